@@ -7,12 +7,32 @@
 import os
 import sys
 import shutil
+import tarfile
 import zipfile
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import PyInstaller.__main__
 
-def build_app():
-    """アプリケーションをビルドする"""
+# 配布ZIPの圧縮レベル
+# 一度作るだけのリリース成果物でも、6を超えるレベル（最大9）は
+# 圧縮時間が大きく伸びる割にサイズはほとんど縮まないため使わない
+ZIP_COMPRESSLEVEL = 6
+
+# tar.zst の圧縮レベル（展開速度はレベルによらずほぼ一定）
+ZSTD_LEVEL = 19
+
+# 配布アーカイブの形式
+DIST_FORMATS = ("zip", "tar.zst", "all")
+
+def build_app(dist_format: str = "zip"):
+    """
+    アプリケーションをビルドする
+    
+    Args:
+        dist_format: 配布アーカイブの形式（zip, tar.zst, all）
+    """
     
     # プロジェクトルート
     project_root = Path(__file__).parent
@@ -48,16 +68,17 @@ def build_app():
         '--hidden-import=utils.logger',
         '--hidden-import=utils.file_utils',
         '--hidden-import=utils.date_utils',
-        '--hidden-import=sumy',
-        '--hidden-import=janome',
         '--hidden-import=openpyxl',
         '--hidden-import=docx',
         '--hidden-import=yaml',
-        '--hidden-import=pandas',
-        '--hidden-import=numpy',
-        '--collect-all=sumy',
-        '--collect-all=janome',
-        '--collect-all=nltk',
+        # 実行時に使用しないモジュールは同梱しない
+        # （要約ライブラリ sumy / janome は現在無効化されている）
+        '--exclude-module=pandas',
+        '--exclude-module=numpy',
+        '--exclude-module=nltk',
+        '--exclude-module=tkinter',
+        '--exclude-module=test',
+        '--exclude-module=unittest',
         '--noupx',
         '--clean'
     ]
@@ -74,14 +95,55 @@ def build_app():
         print("ビルドが完了しました！")
         
         # 配布用フォルダを作成
-        create_distribution_folder()
+        create_distribution_folder(dist_format)
         
     except Exception as e:
         print(f"ビルドエラー: {e}")
         sys.exit(1)
 
-def create_distribution_folder():
-    """配布用フォルダとZIPファイルを作成"""
+def _copy_file(src: Path, dst: Path):
+    """ファイルをコピー（macOSのAPFSではclonefileで複製を試みる）"""
+    if sys.platform == 'darwin':
+        import ctypes
+        libc = ctypes.CDLL('/usr/lib/libSystem.dylib', use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+def _fast_copytree(src: Path, dst: Path):
+    """
+    ディレクトリツリーを高速にコピー
+    
+    Windowsではrobocopyのマルチスレッドコピー、それ以外では
+    ファイル単位のコピーをスレッドプールで並列実行する。
+    """
+    if sys.platform == 'win32':
+        result = subprocess.run(
+            ['robocopy', str(src), str(dst), '/E', '/MT:16', '/NFL', '/NDL', '/NJH', '/NJS', '/NP'],
+            stdout=subprocess.DEVNULL
+        )
+        # robocopyは8未満が成功（1=コピーあり, 2以上=追加情報）
+        if result.returncode >= 8:
+            raise RuntimeError(f"robocopyが失敗しました（終了コード {result.returncode}）: {src}")
+        return
+    
+    files = [path for path in src.rglob('*') if path.is_file()]
+    for directory in {dst / path.relative_to(src).parent for path in files} | {dst}:
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        futures = [executor.submit(_copy_file, path, dst / path.relative_to(src)) for path in files]
+        for future in futures:
+            future.result()
+
+def create_distribution_folder(dist_format: str = "zip"):
+    """
+    配布用フォルダとアーカイブを作成
+    
+    Args:
+        dist_format: 配布アーカイブの形式（zip, tar.zst, all）
+    """
     project_root = Path(__file__).parent
     dist_dir = project_root / "dist"
     portable_dir = dist_dir / "AutoMakeDocument"
@@ -108,22 +170,60 @@ def create_distribution_folder():
             if src_path.is_file():
                 shutil.copy2(src_path, dst_path)
             else:
-                shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
+                _fast_copytree(src_path, dst_path)
     
-    # ZIPファイルを作成
+    print(f"配布用フォルダを作成しました: {portable_dir}")
+    
+    if dist_format in ("zip", "all"):
+        _create_zip(portable_dir, dist_dir)
+    if dist_format in ("tar.zst", "all"):
+        _create_tar_zst(portable_dir, dist_dir)
+
+def _create_zip(portable_dir: Path, dist_dir: Path):
+    """配布用ZIPファイルを作成"""
     zip_path = dist_dir / "AutoMakeDocument.zip"
     if zip_path.exists():
         zip_path.unlink()
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                         compresslevel=ZIP_COMPRESSLEVEL) as zipf:
         for file_path in portable_dir.rglob('*'):
             if file_path.is_file():
                 arcname = file_path.relative_to(dist_dir)
                 zipf.write(file_path, arcname)
     
-    print(f"配布用フォルダを作成しました: {portable_dir}")
     print(f"ZIPファイルを作成しました: {zip_path}")
     print(f"ZIPファイルサイズ: {zip_path.stat().st_size / (1024*1024):.1f}MB")
 
+def _create_tar_zst(portable_dir: Path, dist_dir: Path):
+    """配布用 tar.zst ファイルを作成（zstandard が必要）"""
+    try:
+        import zstandard
+    except ImportError:
+        print("zstandard がインストールされていないため tar.zst の作成をスキップします")
+        return
+    
+    archive_path = dist_dir / "AutoMakeDocument.tar.zst"
+    
+    # threads=-1 で全コアを使ってブロック単位に並列圧縮する
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+    with open(archive_path, 'wb') as raw_file:
+        with compressor.stream_writer(raw_file) as writer:
+            with tarfile.open(fileobj=writer, mode='w|') as tar:
+                tar.add(portable_dir, arcname=portable_dir.name)
+    
+    print(f"tar.zstファイルを作成しました: {archive_path}")
+    print(f"tar.zstファイルサイズ: {archive_path.stat().st_size / (1024*1024):.1f}MB")
+
 if __name__ == "__main__":
-    build_app() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="ドキュメント自動要約&作成アプリをビルドする")
+    parser.add_argument("--dist-format", choices=DIST_FORMATS, default="zip",
+                        help="配布アーカイブの形式（既定: zip）")
+    args = parser.parse_args()
+    
+    # PyInstaller 6.2 はビルド側インタープリタの最適化レベルでバイトコードを
+    # 収集するため、-OO で再実行して docstring を除いた小さな .pyc を同梱する
+    if sys.flags.optimize < 2:
+        sys.exit(subprocess.call([sys.executable, '-OO'] + sys.argv))
+    
+    build_app(args.dist_format) 
\ No newline at end of file
@@ -7,11 +7,7 @@
 import sys
 import os
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
 
-from gui.main_window import MainWindow
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 
@@ -49,6 +45,11 @@ class AutoMakeDocumentApp:
     
     def _create_directories(self):
         """必要なディレクトリを作成"""
+        # 作成済みの印があれば2回目以降の起動では何もしない
+        sentinel = self.data_dir / ".dirs_ok"
+        if sentinel.exists():
+            return
+        
         dirs_to_create = [
             self.data_dir,
             self.data_dir / "logs",
@@ -61,6 +62,8 @@ class AutoMakeDocumentApp:
         
         for directory in dirs_to_create:
             directory.mkdir(parents=True, exist_ok=True)
+        
+        sentinel.touch()
             
     def _initialize_config(self):
         """設定管理を初期化"""
@@ -72,6 +75,11 @@ class AutoMakeDocumentApp:
         
     def run(self):
         """アプリケーションを実行"""
+        # Qt とGUIモジュールは起動時にのみ読み込む
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtGui import QIcon
+        from gui.main_window import MainWindow
+        
         try:
             # Qt アプリケーションを作成
             self.app = QApplication(sys.argv)
@@ -3,14 +3,29 @@
 ドキュメント自動要約&作成アプリ - コア パッケージ
 """
 
-from .data_manager import DataManager
-from .summarizer import Summarizer
-from .template_engine import TemplateEngine
-from .llm_processor import LLMProcessor
+import importlib
+
+# 公開クラス名 → サブモジュール名（初回アクセス時に読み込む）
+_MODULE_MAP = {
+    'DataManager': 'data_manager',
+    'Summarizer': 'summarizer',
+    'TemplateEngine': 'template_engine',
+    'LLMProcessor': 'llm_processor'
+}
 
 __all__ = [
     'DataManager',
     'Summarizer',
     'TemplateEngine',
     'LLMProcessor'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """公開クラスを遅延インポート（PEP 562）"""
+    if name in _MODULE_MAP:
+        module = importlib.import_module('.' + _MODULE_MAP[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,15 +3,23 @@
 データ管理クラス
 """
 
-import json
+import os
+import re
+import heapq
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 from dataclasses import dataclass, asdict
 
 from utils.file_utils import FileUtils
 from utils.date_utils import DateUtils
 
+# ログファイル名（YYYY-MM-DD.json）の日付部分
+_LOG_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
 @dataclass
 class WorkLog:
     """作業ログデータクラス"""
@@ -28,6 +36,15 @@ class WorkLog:
 class DataManager:
     """データ管理クラス"""
     
+    # ログファイル並列読み込みの最大スレッド数
+    MAX_READ_WORKERS = 8
+    
+    # パース済みログキャッシュの最大件数
+    LOG_CACHE_SIZE = 512
+    
+    # 統計用文字数ファイルのフォーマットバージョン
+    STATS_VERSION = 1
+    
     def __init__(self, data_dir: Path):
         """
         初期化
@@ -38,6 +55,19 @@ class DataManager:
         self.data_dir = Path(data_dir)
         self.logs_dir = self.data_dir / "logs"
         
+        # パース済みログのキャッシュ（パス → (更新時刻ns, WorkLog)）
+        self._log_cache: "OrderedDict[Path, Tuple[int, WorkLog]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # 検索用の小文字化済みテキスト（日付文字列 → (更新時刻ns, 本文, タグ)、本文が空のログは本文None）
+        self._search_texts: Dict[str, Tuple[int, Optional[str], Tuple[str, ...]]] = {}
+        self._search_lock = threading.Lock()
+        
+        # 統計用の文字数（日付文字列 → [更新時刻ns, 文字数]、初回の統計取得時に読み込む）
+        self.stats_path = self.data_dir / "stats.json"
+        self._stats_docs: Optional[Dict[str, List[int]]] = None
+        self._stats_lock = threading.Lock()
+        
         # ディレクトリを作成
         self.logs_dir.mkdir(parents=True, exist_ok=True)
     
@@ -59,40 +89,21 @@ class DataManager:
             
             now = datetime.now().isoformat()
             
-            # 既存のログがあるかチェック
-            if file_path.exists():
-                existing_log = self.load_work_log(log_date)
-                if existing_log:
-                    # 更新
-                    work_log = WorkLog(
-                        date=date_str,
-                        content=content,
-                        created_at=existing_log.created_at,
-                        updated_at=now,
-                        tags=tags or []
-                    )
-                else:
-                    # 新規作成
-                    work_log = WorkLog(
-                        date=date_str,
-                        content=content,
-                        created_at=now,
-                        updated_at=now,
-                        tags=tags or []
-                    )
-            else:
-                # 新規作成
-                work_log = WorkLog(
-                    date=date_str,
-                    content=content,
-                    created_at=now,
-                    updated_at=now,
-                    tags=tags or []
-                )
+            # 既存のログがあれば作成日時を引き継ぐ
+            work_log = WorkLog(
+                date=date_str,
+                content=content,
+                created_at=self._peek_created_at(file_path) or now,
+                updated_at=now,
+                tags=tags or []
+            )
             
             # ファイルに保存
             log_data = asdict(work_log)
-            FileUtils.write_text_file(file_path, json.dumps(log_data, ensure_ascii=False, indent=2))
+            FileUtils.write_json_file(file_path, log_data)
+            self._invalidate_cache(file_path)
+            self._invalidate_search_text(date_str)
+            self._update_stats(date_str, file_path, work_log)
             
             return True
             
@@ -117,15 +128,160 @@ class DataManager:
             if not file_path.exists():
                 return None
             
-            content = FileUtils.read_text_file(file_path)
-            log_data = json.loads(content)
-            
-            return WorkLog(**log_data)
+            return self._read_log_file(file_path)
             
         except Exception as e:
             print(f"作業ログ読み込みエラー: {e}")
             return None
     
+    def _read_log_file(self, file_path: Path) -> Optional[WorkLog]:
+        """
+        ログファイルを読み込んでWorkLogに変換
+        
+        Args:
+            file_path: ログファイルパス
+            
+        Returns:
+            Optional[WorkLog]: 作業ログ（読み込み失敗時はNone）
+        """
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+            
+            # 更新時刻が変わっていなければキャッシュを返す
+            with self._cache_lock:
+                cached = self._log_cache.get(file_path)
+                if cached and cached[0] == mtime_ns:
+                    self._log_cache.move_to_end(file_path)
+                    return cached[1]
+            
+            log_data = FileUtils.read_json_file(file_path)
+            work_log = WorkLog(**log_data)
+            
+            with self._cache_lock:
+                self._log_cache[file_path] = (mtime_ns, work_log)
+                self._log_cache.move_to_end(file_path)
+                while len(self._log_cache) > self.LOG_CACHE_SIZE:
+                    self._log_cache.popitem(last=False)
+            
+            return work_log
+        except Exception as e:
+            print(f"作業ログ読み込みエラー ({file_path.name}): {e}")
+            return None
+    
+    def _peek_created_at(self, file_path: Path) -> Optional[str]:
+        """
+        既存ログの作成日時のみを取得
+        
+        Args:
+            file_path: ログファイルパス
+            
+        Returns:
+            Optional[str]: 作成日時（ファイルが存在しない・読めない場合はNone）
+        """
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+            with self._cache_lock:
+                cached = self._log_cache.get(file_path)
+            if cached and cached[0] == mtime_ns:
+                return cached[1].created_at
+            
+            # WorkLogは組み立てずに必要な項目だけ取り出す
+            return FileUtils.read_json_file(file_path).get("created_at")
+        except Exception:
+            return None
+    
+    def _invalidate_cache(self, file_path: Path):
+        """
+        ログキャッシュから指定ファイルを破棄
+        
+        Args:
+            file_path: ログファイルパス
+        """
+        with self._cache_lock:
+            self._log_cache.pop(file_path, None)
+    
+    def _iter_existing_logs(self, start_date: Optional[date] = None,
+                            end_date: Optional[date] = None) -> Iterator[Tuple[date, Path]]:
+        """
+        存在するログファイルを列挙
+        
+        ディレクトリを一度だけ走査し、日付ごとの存在確認を行わない。
+        
+        Args:
+            start_date: 開始日（指定しない場合は制限なし）
+            end_date: 終了日（指定しない場合は制限なし）
+            
+        Yields:
+            Tuple[date, Path]: ログの日付とファイルパス（順不同）
+        """
+        try:
+            with os.scandir(self.logs_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json") or not entry.is_file():
+                        continue
+                    
+                    # strptimeを使わず正規表現で日付を取り出す
+                    match = _LOG_DATE_RE.fullmatch(entry.name[:-5])
+                    if match is None:
+                        continue
+                    try:
+                        log_date = date(int(match[1]), int(match[2]), int(match[3]))
+                    except ValueError:
+                        continue
+                    if start_date and log_date < start_date:
+                        continue
+                    if end_date and log_date > end_date:
+                        continue
+                    
+                    yield log_date, Path(entry.path)
+        except OSError as e:
+            print(f"ログディレクトリ走査エラー: {e}")
+    
+    def _load_logs(self, start_date: Optional[date] = None,
+                   end_date: Optional[date] = None) -> List[WorkLog]:
+        """
+        指定期間のログファイルを並列に読み込み
+        
+        Args:
+            start_date: 開始日（指定しない場合は制限なし）
+            end_date: 終了日（指定しない場合は制限なし）
+            
+        Returns:
+            List[WorkLog]: 日付順の作業ログリスト
+        """
+        entries = sorted(self._iter_existing_logs(start_date, end_date))
+        return self._read_log_files([path for _, path in entries])
+    
+    def _read_log_files(self, paths: List[Path]) -> List[WorkLog]:
+        """
+        複数のログファイルを並列に読み込み
+        
+        Args:
+            paths: ログファイルパスのリスト
+            
+        Returns:
+            List[WorkLog]: 読み込めた作業ログ（pathsの順序を維持）
+        """
+        return [log for log in self._map_log_files(paths) if log is not None]
+    
+    def _map_log_files(self, paths: List[Path]) -> List[Optional[WorkLog]]:
+        """
+        複数のログファイルを並列に読み込み、読み込めなかったファイルはNoneとする
+        
+        Args:
+            paths: ログファイルパスのリスト
+            
+        Returns:
+            List[Optional[WorkLog]]: pathsと同じ並びの作業ログ
+        """
+        if not paths:
+            return []
+        
+        # ファイル読み込みはI/O待ちが主なのでスレッドで重ねる
+        workers = min(self.MAX_READ_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._read_log_file, paths))
+    
     def get_work_logs_by_date_range(self, start_date: date, end_date: date) -> List[WorkLog]:
         """
         指定された期間の作業ログを取得
@@ -137,15 +293,7 @@ class DataManager:
         Returns:
             List[WorkLog]: 作業ログリスト
         """
-        logs = []
-        date_range = DateUtils.get_date_range(start_date, end_date)
-        
-        for target_date in date_range:
-            log = self.load_work_log(target_date)
-            if log and log.content.strip():
-                logs.append(log)
-        
-        return logs
+        return [log for log in self._load_logs(start_date, end_date) if log.content.strip()]
     
     def get_weekly_logs(self, target_date: date) -> List[WorkLog]:
         """
@@ -180,18 +328,20 @@ class DataManager:
         Returns:
             List[date]: ログファイルの日付リスト
         """
-        dates = []
-        
-        try:
-            for file_path in self.logs_dir.glob("*.json"):
-                date_str = file_path.stem
-                parsed_date = DateUtils.parse_date(date_str)
-                if parsed_date:
-                    dates.append(parsed_date)
-        except Exception as e:
-            print(f"ログ日付取得エラー: {e}")
+        return sorted(log_date for log_date, _ in self._iter_existing_logs())
+    
+    def get_recent_log_dates(self, n: int) -> List[date]:
+        """
+        新しい順に指定件数のログファイルの日付を取得
         
-        return sorted(dates)
+        Args:
+            n: 取得する件数
+            
+        Returns:
+            List[date]: ログファイルの日付リスト（新しい順）
+        """
+        # 全件を並べ替えずに上位n件だけを取り出す
+        return heapq.nlargest(n, (log_date for log_date, _ in self._iter_existing_logs()))
     
     def delete_work_log(self, log_date: date) -> bool:
         """
@@ -207,6 +357,9 @@ class DataManager:
             date_str = DateUtils.format_date(log_date)
             file_path = self.logs_dir / f"{date_str}.json"
             
+            self._invalidate_cache(file_path)
+            self._invalidate_search_text(date_str)
+            self._update_stats(date_str, file_path, None)
             return FileUtils.delete_file(file_path)
             
         except Exception as e:
@@ -228,20 +381,32 @@ class DataManager:
         if not keyword:
             return []
         
-        # 検索範囲を設定
-        if start_date and end_date:
-            logs = self.get_work_logs_by_date_range(start_date, end_date)
-        else:
-            # 全期間から検索
-            all_dates = self.get_all_log_dates()
-            logs = []
-            for log_date in all_dates:
-                log = self.load_work_log(log_date)
-                if log and log.content.strip():
-                    logs.append(log)
-        
-        # キーワードで絞り込み
         keyword_lower = keyword.lower()
+        
+        try:
+            # 小文字化済みのテキストで照合し、該当ログだけを読み込む
+            with self._search_lock:
+                texts = self._refresh_search_texts()
+                matched = [date_str for date_str, (_, content, tags) in texts.items()
+                           if content is not None and
+                           (keyword_lower in content or any(keyword_lower in tag for tag in tags))]
+            if start_date and end_date:
+                start_str = DateUtils.format_date(start_date)
+                end_str = DateUtils.format_date(end_date)
+                matched = [d for d in matched if start_str <= d <= end_str]
+            
+            logs = self._read_log_files([self.logs_dir / f"{d}.json" for d in sorted(matched)])
+            logs = [log for log in logs if log.content.strip()]
+        except Exception as e:
+            print(f"検索キャッシュエラー: {e}")
+            
+            # キャッシュが使えない場合は全件を走査
+            if start_date and end_date:
+                logs = self.get_work_logs_by_date_range(start_date, end_date)
+            else:
+                logs = [log for log in self._load_logs() if log.content.strip()]
+        
+        # キーワードで絞り込み（照合後に書き換えられたログを除くため本文で確定）
         filtered_logs = []
         
         for log in logs:
@@ -252,6 +417,136 @@ class DataManager:
         
         return filtered_logs
     
+    def _refresh_search_texts(self) -> Dict[str, Tuple[int, Optional[str], Tuple[str, ...]]]:
+        """
+        検索用テキストをログファイルと突き合わせて更新
+        
+        更新時刻が変わったログだけを読み直すため、アプリ外で
+        編集・削除されたログも次の検索から反映される。
+        
+        Returns:
+            Dict[str, Tuple[int, Optional[str], Tuple[str, ...]]]: 日付文字列 → (更新時刻ns, 本文, タグ)
+        """
+        texts = self._search_texts
+        
+        on_disk = {}
+        for log_date, path in self._iter_existing_logs():
+            try:
+                on_disk[DateUtils.format_date(log_date)] = (path, path.stat().st_mtime_ns)
+            except OSError:
+                continue
+        
+        for date_str in [d for d in texts if d not in on_disk]:
+            del texts[date_str]
+        
+        stale = sorted(d for d, (_, mtime_ns) in on_disk.items()
+                       if d not in texts or texts[d][0] != mtime_ns)
+        logs = self._map_log_files([on_disk[d][0] for d in stale])
+        for date_str, log in zip(stale, logs):
+            # 読み込めないログも記録し、更新されるまで読み直さない
+            if log is None or not log.content.strip():
+                texts[date_str] = (on_disk[date_str][1], None, ())
+            else:
+                texts[date_str] = (on_disk[date_str][1], log.content.lower(),
+                                   tuple(tag.lower() for tag in log.tags))
+        return texts
+    
+    def _invalidate_search_text(self, date_str: str):
+        """
+        保存・削除されたログの検索用テキストを破棄（次回検索時に読み直す）
+        
+        Args:
+            date_str: 日付文字列
+        """
+        with self._search_lock:
+            self._search_texts.pop(date_str, None)
+    
+    def _load_stats(self) -> Dict[str, List[int]]:
+        """
+        統計用の文字数ファイルを読み込み、ログファイルとの差分を反映
+        
+        ディレクトリとの突き合わせは読み込み時の一度だけ行い、
+        以降は保存・削除時に更新する。
+        
+        Returns:
+            Dict[str, List[int]]: 日付文字列 → [更新時刻ns, 文字数]
+        """
+        stats_docs: Dict[str, List[int]] = {}
+        try:
+            if self.stats_path.exists():
+                stats_data = FileUtils.read_json_file(self.stats_path)
+                if stats_data.get("version") == self.STATS_VERSION:
+                    stats_docs = stats_data.get("docs", {})
+        except Exception as e:
+            print(f"統計ファイル読み込みエラー: {e}")
+        
+        # ディスク上のログと突き合わせ、更新時刻が変わったログだけ読み込む
+        on_disk = {DateUtils.format_date(log_date): path
+                   for log_date, path in self._iter_existing_logs()}
+        changed = False
+        for date_str in [d for d in stats_docs if d not in on_disk]:
+            del stats_docs[date_str]
+            changed = True
+        
+        stale = {}
+        for date_str, path in on_disk.items():
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            entry = stats_docs.get(date_str)
+            if entry is None or entry[0] != mtime_ns:
+                stale[date_str] = mtime_ns
+        
+        if stale:
+            # ファイル名の日付で記録し、読み込めないログも文字数0として件数に含める
+            stale_dates = sorted(stale)
+            logs = self._map_log_files([on_disk[d] for d in stale_dates])
+            for date_str, log in zip(stale_dates, logs):
+                stats_docs[date_str] = [stale[date_str], len(log.content) if log and log.content else 0]
+            changed = True
+        
+        self._stats_docs = stats_docs
+        if changed:
+            self._write_stats()
+        return stats_docs
+    
+    def _write_stats(self):
+        """統計用の文字数ファイルを保存"""
+        try:
+            FileUtils.write_json_file(self.stats_path, {
+                "version": self.STATS_VERSION,
+                "docs": self._stats_docs
+            }, indent=False)
+        except Exception as e:
+            print(f"統計ファイル保存エラー: {e}")
+    
+    def _update_stats(self, date_str: str, file_path: Path, work_log: Optional[WorkLog]):
+        """
+        保存・削除されたログを統計用の文字数に反映
+        
+        未読み込みの場合は、次回読み込み時の差分反映に任せる。
+        
+        Args:
+            date_str: 日付文字列
+            file_path: ログファイルパス
+            work_log: 保存した作業ログ（削除時はNone）
+        """
+        with self._stats_lock:
+            if self._stats_docs is None:
+                return
+            
+            if work_log is None:
+                if self._stats_docs.pop(date_str, None) is None:
+                    return
+            else:
+                try:
+                    mtime_ns = file_path.stat().st_mtime_ns
+                except OSError:
+                    return
+                self._stats_docs[date_str] = [mtime_ns, len(work_log.content)]
+            self._write_stats()
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         統計情報を取得
@@ -259,9 +554,25 @@ class DataManager:
         Returns:
             Dict[str, Any]: 統計情報
         """
-        all_dates = self.get_all_log_dates()
+        try:
+            # 保存済みの文字数を集計し、ログ本文は読まない
+            with self._stats_lock:
+                stats_docs = self._stats_docs
+                if stats_docs is None:
+                    stats_docs = self._load_stats()
+                total_characters = sum(entry[1] for entry in stats_docs.values())
+                date_strs = sorted(stats_docs)
+            log_dates = [DateUtils.parse_date(d) for d in date_strs]
+        except Exception as e:
+            print(f"統計ファイルエラー: {e}")
+            
+            # 統計ファイルが使えない場合は全ログを読み込んで集計
+            entries = sorted(self._iter_existing_logs())
+            logs = self._read_log_files([path for _, path in entries])
+            total_characters = sum(len(log.content) for log in logs if log.content)
+            log_dates = [log_date for log_date, _ in entries]
         
-        if not all_dates:
+        if not log_dates:
             return {
                 "total_logs": 0,
                 "first_log_date": None,
@@ -270,19 +581,12 @@ class DataManager:
                 "average_characters_per_log": 0
             }
         
-        total_characters = 0
-        
-        for log_date in all_dates:
-            log = self.load_work_log(log_date)
-            if log and log.content:
-                total_characters += len(log.content)
-        
         return {
-            "total_logs": len(all_dates),
-            "first_log_date": all_dates[0],
-            "last_log_date": all_dates[-1],
+            "total_logs": len(log_dates),
+            "first_log_date": log_dates[0],
+            "last_log_date": log_dates[-1],
             "total_characters": total_characters,
-            "average_characters_per_log": total_characters // len(all_dates) if all_dates else 0
+            "average_characters_per_log": total_characters // len(log_dates)
         }
     
     def export_logs_to_json(self, start_date: date, end_date: date, output_file: Path) -> bool:
@@ -310,7 +614,7 @@ class DataManager:
                 "logs": logs_data
             }
             
-            FileUtils.write_text_file(output_file, json.dumps(export_data, ensure_ascii=False, indent=2))
+            FileUtils.write_json_file(output_file, export_data)
             return True
             
         except Exception as e:
@@ -5,8 +5,13 @@ LLMプロセッサークラス
 
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
+import os
+import re
+import time
 import json
-from dataclasses import dataclass
+import functools
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 
 # オプション：ローカルLLM対応
@@ -19,6 +24,157 @@ except ImportError:
 from core.data_manager import WorkLog
 from utils.date_utils import DateUtils
 
+# 共有しているllama.cppハンドルへの呼び出しを直列化するロック
+_LLM_LOCK = threading.Lock()
+
+# KVキャッシュの型名 → ggml_type の値
+_KV_CACHE_TYPES = {"f32": 0, "f16": 1, "q4_0": 2, "q8_0": 8}
+
+# 読み込み済みのLlamaハンドル（(設定, Llama)、保持するのは1つだけ）
+_LLAMA_HANDLE: Optional[tuple] = None
+
+def _get_llama(model_path: str, n_ctx: int, n_threads: int,
+               n_threads_batch: int, n_batch: int, n_ubatch: int,
+               use_mmap: bool, use_mlock: bool,
+               type_k: Optional[int], type_v: Optional[int]) -> "Llama":
+    """
+    Llamaインスタンスを取得（同じ設定ならプロセス内で使い回す）
+    
+    モデルの読み込みとコンテキスト（KVキャッシュ）の確保は重いため、
+    LLMProcessorを作り直しても同じハンドルを再利用する。設定が変わった
+    場合は古いハンドルを手放してから読み込み、モデルを複数抱えない。
+    呼び出し側で_LLM_LOCKを取得しておくこと。
+    """
+    global _LLAMA_HANDLE
+    
+    key = (model_path, n_ctx, n_threads, n_threads_batch, n_batch, n_ubatch,
+           use_mmap, use_mlock, type_k, type_v)
+    if _LLAMA_HANDLE is not None and _LLAMA_HANDLE[0] == key:
+        return _LLAMA_HANDLE[1]
+    
+    _LLAMA_HANDLE = None
+    llm = Llama(
+        model_path=model_path,
+        n_ctx=n_ctx,
+        n_threads=n_threads,
+        n_threads_batch=n_threads_batch,
+        n_batch=n_batch,
+        n_ubatch=n_ubatch,
+        use_mmap=use_mmap,
+        use_mlock=use_mlock,
+        type_k=type_k,
+        type_v=type_v,
+        verbose=False
+    )
+    _LLAMA_HANDLE = (key, llm)
+    return llm
+
+@functools.lru_cache(maxsize=1024)
+def _format_log_fragment(date_str: str, content: str) -> str:
+    """
+    LLM用に1件分のログを整形（内容が空・日付が不正な場合は空文字）
+    
+    Args:
+        date_str: 日付文字列（YYYY-MM-DD）
+        content: ログ内容
+        
+    Returns:
+        str: 整形されたログ
+    """
+    content = content.strip()
+    if not content:
+        return ""
+    log_date = DateUtils.parse_date(date_str)
+    if not log_date:
+        return ""
+    return f"[{DateUtils.format_date_japanese(log_date)}]\n{content}\n"
+
+# プロンプトテンプレート（呼び出しごとに組み立て直さないようモジュール定数にする）
+_DEFAULT_SUMMARY_TMPL = """以下の作業ログを簡潔に要約してください。重要なポイントと主な成果を含めてください。
+
+作業期間: {date_range}
+ログ件数: {log_count}件
+
+作業ログ:
+{logs}
+
+要約:"""
+
+_DAILY_TMPL = """以下の日報を要約してください。
+
+日付: {date_range}
+作業内容:
+{logs}
+
+以下の形式で要約してください：
+## 主な成果
+- 
+
+## 課題・問題点
+- 
+
+## 明日の予定
+- 
+
+要約:"""
+
+_WEEKLY_TMPL = """以下の週間作業ログを要約してください。
+
+期間: {date_range}
+作業内容:
+{logs}
+
+以下の形式で要約してください：
+## 今週の主な成果
+- 
+
+## 完了したタスク
+- 
+
+## 進行中のタスク
+- 
+
+## 課題・問題点
+- 
+
+## 来週の予定
+- 
+
+要約:"""
+
+_MONTHLY_TMPL = """以下の月間作業ログを要約してください。
+
+期間: {date_range}
+作業内容:
+{logs}
+
+以下の形式で要約してください：
+## 今月の主な成果
+- 
+
+## 完了したプロジェクト
+- 
+
+## 進行中のプロジェクト
+- 
+
+## 課題・改善点
+- 
+
+## 来月の計画
+- 
+
+要約:"""
+
+_STRUCTURED_TEMPLATES = {
+    "daily": _DAILY_TMPL,
+    "weekly": _WEEKLY_TMPL,
+    "monthly": _MONTHLY_TMPL,
+}
+
+# 構造化応答の見出し行・箇条書き行（前後の空白は除く）
+_RESPONSE_LINE_RE = re.compile(r'^[^\S\n]*(## |- )[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+
 @dataclass
 class LLMConfig:
     """LLM設定クラス"""
@@ -28,7 +184,14 @@ class LLMConfig:
     temperature: float = 0.7
     top_p: float = 0.95
     repeat_penalty: float = 1.1
-    threads: int = 4
+    threads: int = field(default_factory=lambda: min(16, os.cpu_count() or 4))
+    n_threads_batch: Optional[int] = None  # 未指定時はthreadsと同じ
+    n_batch: int = 2048   # プロンプト読み込み時のバッチサイズ
+    n_ubatch: int = 512
+    use_mmap: bool = True    # メモリ不足になりやすい環境ではFalseにすると安定する場合がある
+    use_mlock: bool = False  # モデルをRAMに固定してスワップアウトを防ぐ
+    type_k: str = "f16"      # KVキャッシュの型（f32, f16, q8_0, q4_0）。量子化すると帯域・メモリを削減
+    type_v: str = "f16"
 
 @dataclass
 class LLMResponse:
@@ -42,6 +205,12 @@ class LLMResponse:
 class LLMProcessor:
     """LLMプロセッサークラス"""
     
+    # 生成停止トークン（llama_cppはlist以外を無視するためlistで保持）
+    _STOP_TOKENS = ["</s>", "Human:", "Assistant:"]
+    
+    # 分割要約で部分要約に割り当てる最小トークン数（これ以下でも収まらなければ諦める）
+    MIN_PARTIAL_TOKENS = 64
+    
     def __init__(self, config: Optional[LLMConfig] = None):
         """
         初期化
@@ -63,12 +232,20 @@ class LLMProcessor:
             if not self.config:
                 return
             
-            self.llm = Llama(
-                model_path=self.config.model_path,
-                n_ctx=self.config.context_length,
-                n_threads=self.config.threads,
-                verbose=False
-            )
+            # 同時初期化で同じモデルを二重に読み込まないようロック内で取得
+            with _LLM_LOCK:
+                self.llm = _get_llama(
+                    str(self.config.model_path),
+                    self.config.context_length,
+                    self.config.threads,
+                    self.config.n_threads_batch or self.config.threads,
+                    self.config.n_batch,
+                    self.config.n_ubatch,
+                    self.config.use_mmap,
+                    self.config.use_mlock,
+                    _KV_CACHE_TYPES.get(self.config.type_k),
+                    _KV_CACHE_TYPES.get(self.config.type_v)
+                )
             
             self.is_available = True
             print(f"LLMが初期化されました: {self.config.model_path}")
@@ -79,7 +256,8 @@ class LLMProcessor:
     
     def generate_summary(self, logs: List[WorkLog], 
                         prompt_template: str = None,
-                        max_tokens: int = None) -> Optional[LLMResponse]:
+                        max_tokens: int = None,
+                        on_token: Optional[Callable[[str], None]] = None) -> Optional[LLMResponse]:
         """
         作業ログから要約を生成
         
@@ -87,6 +265,7 @@ class LLMProcessor:
             logs: 作業ログリスト
             prompt_template: プロンプトテンプレート
             max_tokens: 最大トークン数
+            on_token: 生成されたトークンを逐次受け取るコールバック（指定時はストリーミング生成）
             
         Returns:
             Optional[LLMResponse]: LLM応答（利用不可の場合はNone）
@@ -95,40 +274,146 @@ class LLMProcessor:
             return None
         
         try:
+            max_tokens = max_tokens or self.config.max_tokens
+            
             # プロンプトを作成
             prompt = self._create_summary_prompt(logs, prompt_template)
             
             # 生成実行
             start_time = datetime.now()
+            start_counter = time.perf_counter()
             
-            response = self.llm(
-                prompt,
-                max_tokens=max_tokens or self.config.max_tokens,
-                temperature=self.config.temperature,
-                top_p=self.config.top_p,
-                repeat_penalty=self.config.repeat_penalty,
-                stop=["</s>", "Human:", "Assistant:"]
-            )
+            # コンテキストに収まらない場合は分割要約してから統合する
+            if len(logs) > 1 and not self._fits_context(prompt, max_tokens):
+                prompt = self._create_reduced_prompt(logs, prompt_template, max_tokens)
+            
+            if on_token is not None:
+                generated_text, tokens_used = self._stream_completion(
+                    prompt, max_tokens, on_token
+                )
+            else:
+                with _LLM_LOCK:
+                    response = self.llm(
+                        prompt,
+                        max_tokens=max_tokens,
+                        temperature=self.config.temperature,
+                        top_p=self.config.top_p,
+                        repeat_penalty=self.config.repeat_penalty,
+                        stop=self._STOP_TOKENS
+                    )
+                generated_text = response["choices"][0]["text"]
+                tokens_used = response["usage"]["total_tokens"]
             
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_counter
             
             # 応答を整形
-            generated_text = response["choices"][0]["text"].strip()
-            tokens_used = response["usage"]["total_tokens"]
+            generated_text = generated_text.strip()
             
             return LLMResponse(
                 text=generated_text,
                 tokens_used=tokens_used,
                 processing_time=processing_time,
                 model_name=str(self.config.model_path),
-                created_at=datetime.now().isoformat()
+                created_at=start_time.isoformat()
             )
             
         except Exception as e:
             print(f"LLM要約生成エラー: {e}")
             return None
     
+    def _fits_context(self, prompt: str, max_tokens: int) -> bool:
+        """プロンプトと生成分がコンテキスト長に収まるかチェック"""
+        with _LLM_LOCK:
+            prompt_tokens = len(self.llm.tokenize(prompt.encode("utf-8")))
+        return prompt_tokens + max_tokens <= self.config.context_length
+    
+    def _create_reduced_prompt(self, logs: List[WorkLog], template: str,
+                               max_tokens: int, partial_tokens: Optional[int] = None) -> str:
+        """
+        長すぎるログを分割して要約し、その要約を統合するプロンプトを作成
+        
+        Args:
+            logs: 作業ログリスト
+            template: プロンプトテンプレート
+            max_tokens: 最大トークン数
+            partial_tokens: 部分要約ごとの最大トークン数（指定しない場合は統合後に収まる量から決める）
+            
+        Returns:
+            str: 部分要約をまとめたプロンプト
+        """
+        if partial_tokens is None:
+            # 2つの部分要約と統合時の生成分がコンテキストに収まるよう割り当てる
+            partial_tokens = min(max_tokens, (self.config.context_length - max_tokens) // 2)
+        if partial_tokens < self.MIN_PARTIAL_TOKENS:
+            raise RuntimeError("部分要約を統合してもコンテキスト長に収まりません")
+        
+        middle = len(logs) // 2
+        partial_texts = []
+        
+        for part in (logs[:middle], logs[middle:]):
+            # 各部分もコンテキストを超える場合はgenerate_summary内で再帰的に分割される
+            partial = self.generate_summary(part, template, partial_tokens)
+            if partial is None:
+                raise RuntimeError("部分要約の生成に失敗しました")
+            partial_texts.append(f"[{self._get_date_range_string(part)}]\n{partial.text}")
+        
+        if template is None:
+            template = self._get_default_summary_template()
+        
+        prompt = template.format(
+            logs="\n\n".join(partial_texts),
+            log_count=len(logs),
+            date_range=self._get_date_range_string(logs)
+        )
+        
+        # テンプレートや見出しの分で統合後も収まらない場合は、部分要約を短くして作り直す
+        if not self._fits_context(prompt, max_tokens):
+            return self._create_reduced_prompt(logs, template, max_tokens, partial_tokens // 2)
+        
+        return prompt
+    
+    def _stream_completion(self, prompt: str, max_tokens: int,
+                           on_token: Callable[[str], None]) -> tuple:
+        """
+        ストリーミングで生成し、トークンごとにコールバックを呼ぶ
+        
+        Args:
+            prompt: プロンプト
+            max_tokens: 最大トークン数
+            on_token: トークン受信コールバック
+            
+        Returns:
+            tuple: (生成テキスト, 使用トークン数)
+        """
+        pieces = []
+        usage = None
+        
+        with _LLM_LOCK:
+            for chunk in self.llm(
+                prompt,
+                max_tokens=max_tokens,
+                temperature=self.config.temperature,
+                top_p=self.config.top_p,
+                repeat_penalty=self.config.repeat_penalty,
+                stop=self._STOP_TOKENS,
+                stream=True
+            ):
+                token = chunk["choices"][0]["text"]
+                if token:
+                    pieces.append(token)
+                    on_token(token)
+                usage = chunk.get("usage") or usage
+            
+            generated_text = "".join(pieces)
+            if usage:
+                return generated_text, usage["total_tokens"]
+            
+            # usageが返らない場合はチャンク数ではなく、プロンプトと生成結果をトークン化して数える
+            prompt_tokens = len(self.llm.tokenize(prompt.encode("utf-8")))
+            completion_tokens = len(self.llm.tokenize(generated_text.encode("utf-8"), add_bos=False))
+        
+        return generated_text, prompt_tokens + completion_tokens
+    
     def _create_summary_prompt(self, logs: List[WorkLog], 
                               template: str = None) -> str:
         """
@@ -158,48 +443,35 @@ class LLMProcessor:
     
     def _get_default_summary_template(self) -> str:
         """デフォルトの要約テンプレートを取得"""
-        return """以下の作業ログを簡潔に要約してください。重要なポイントと主な成果を含めてください。
-
-作業期間: {date_range}
-ログ件数: {log_count}件
-
-作業ログ:
-{logs}
-
-要約:"""
+        return _DEFAULT_SUMMARY_TMPL
     
     def _format_logs_for_llm(self, logs: List[WorkLog]) -> str:
         """LLM用にログを整形"""
-        formatted_logs = []
-        
-        for log in logs:
-            if log.content.strip():
-                log_date = DateUtils.parse_date(log.date)
-                if log_date:
-                    date_str = DateUtils.format_date_japanese(log_date)
-                    formatted_logs.append(f"[{date_str}]")
-                    formatted_logs.append(log.content.strip())
-                    formatted_logs.append("")
-        
-        return "\n".join(formatted_logs)
+        # ログ単位の整形結果はキャッシュされるため、範囲が重なる再要約では再利用される
+        fragments = (_format_log_fragment(log.date, log.content) for log in logs)
+        return "\n".join(fragment for fragment in fragments if fragment)
     
     def _get_date_range_string(self, logs: List[WorkLog]) -> str:
         """日付範囲の文字列を取得"""
         if not logs:
             return "不明"
         
-        dates = []
+        # ソートせず1パスで最小・最大を求める
+        first = last = None
         for log in logs:
             log_date = DateUtils.parse_date(log.date)
-            if log_date:
-                dates.append(log_date)
+            if not log_date:
+                continue
+            if first is None or log_date < first:
+                first = log_date
+            if last is None or log_date > last:
+                last = log_date
         
-        if not dates:
+        if first is None:
             return "不明"
         
-        dates.sort()
-        start_date = DateUtils.format_date_japanese(dates[0])
-        end_date = DateUtils.format_date_japanese(dates[-1])
+        start_date = DateUtils.format_date_japanese(first)
+        end_date = DateUtils.format_date_japanese(last)
         
         if start_date == end_date:
             return start_date
@@ -226,14 +498,15 @@ class LLMProcessor:
             prompt = self._create_structured_prompt(logs, summary_type)
             
             # 生成実行
-            response = self.llm(
-                prompt,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                top_p=self.config.top_p,
-                repeat_penalty=self.config.repeat_penalty,
-                stop=["</s>", "Human:", "Assistant:"]
-            )
+            with _LLM_LOCK:
+                response = self.llm(
+                    prompt,
+                    max_tokens=self.config.max_tokens,
+                    temperature=self.config.temperature,
+                    top_p=self.config.top_p,
+                    repeat_penalty=self.config.repeat_penalty,
+                    stop=self._STOP_TOKENS
+                )
             
             # 応答を解析
             generated_text = response["choices"][0]["text"].strip()
@@ -251,102 +524,24 @@ class LLMProcessor:
         log_text = self._format_logs_for_llm(logs)
         date_range = self._get_date_range_string(logs)
         
-        prompts = {
-            "daily": f"""以下の日報を要約してください。
-
-日付: {date_range}
-作業内容:
-{log_text}
-
-以下の形式で要約してください：
-## 主な成果
-- 
-
-## 課題・問題点
-- 
-
-## 明日の予定
-- 
-
-要約:""",
-            
-            "weekly": f"""以下の週間作業ログを要約してください。
-
-期間: {date_range}
-作業内容:
-{log_text}
-
-以下の形式で要約してください：
-## 今週の主な成果
-- 
-
-## 完了したタスク
-- 
-
-## 進行中のタスク
-- 
-
-## 課題・問題点
-- 
-
-## 来週の予定
-- 
-
-要約:""",
-            
-            "monthly": f"""以下の月間作業ログを要約してください。
-
-期間: {date_range}
-作業内容:
-{log_text}
-
-以下の形式で要約してください：
-## 今月の主な成果
-- 
-
-## 完了したプロジェクト
-- 
-
-## 進行中のプロジェクト
-- 
-
-## 課題・改善点
-- 
-
-## 来月の計画
-- 
-
-要約:"""
-        }
-        
-        return prompts.get(summary_type, prompts["weekly"])
+        template = _STRUCTURED_TEMPLATES.get(summary_type, _WEEKLY_TMPL)
+        return template.format(logs=log_text, date_range=date_range)
     
     def _parse_structured_response(self, response_text: str, 
                                   summary_type: str) -> Dict[str, Any]:
         """構造化された応答を解析"""
-        # 簡単な解析（実装は省略）
-        sections = {}
-        current_section = None
-        current_items = []
+        # 見出し（## ）と箇条書き（- ）の行だけを1回の正規表現走査で拾う
+        parsed = []
+        for marker, body in _RESPONSE_LINE_RE.findall(response_text):
+            if not body:
+                continue
+            if marker == "## ":
+                parsed.append((body, []))
+            elif parsed:
+                parsed[-1][1].append(body)
         
-        for line in response_text.split('\n'):
-            line = line.strip()
-            
-            if line.startswith('## '):
-                # 前のセクションを保存
-                if current_section and current_items:
-                    sections[current_section] = current_items
-                
-                # 新しいセクション開始
-                current_section = line[3:].strip()
-                current_items = []
-                
-            elif line.startswith('- ') and current_section:
-                current_items.append(line[2:].strip())
-        
-        # 最後のセクションを保存
-        if current_section and current_items:
-            sections[current_section] = current_items
+        # 項目のあるセクションのみ残す
+        sections = {title: items for title, items in parsed if items}
         
         return {
             "summary_type": summary_type,
@@ -378,11 +573,12 @@ class LLMProcessor:
             return False
         
         try:
-            test_response = self.llm(
-                "これはテストです。",
-                max_tokens=10,
-                temperature=0.1
-            )
+            with _LLM_LOCK:
+                test_response = self.llm(
+                    "これはテストです。",
+                    max_tokens=10,
+                    temperature=0.1
+                )
             return test_response is not None
             
         except Exception as e:
@@ -412,14 +608,15 @@ class LLMProcessor:
 
 要約:"""
             
-            response = self.llm(
-                prompt,
-                max_tokens=max_length // 2,  # 概算でトークン数を設定
-                temperature=self.config.temperature,
-                top_p=self.config.top_p,
-                repeat_penalty=self.config.repeat_penalty,
-                stop=["</s>", "Human:", "Assistant:"]
-            )
+            with _LLM_LOCK:
+                response = self.llm(
+                    prompt,
+                    max_tokens=max_length // 2,  # 概算でトークン数を設定
+                    temperature=self.config.temperature,
+                    top_p=self.config.top_p,
+                    repeat_penalty=self.config.repeat_penalty,
+                    stop=self._STOP_TOKENS
+                )
             
             return response["choices"][0]["text"].strip()
             
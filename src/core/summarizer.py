@@ -3,7 +3,9 @@
 要約機能クラス（簡素化版）
 """
 
+import io
 import re
+import sys
 from typing import List, Dict, Any, Optional
 from datetime import date
 from dataclasses import dataclass
@@ -28,7 +30,19 @@ JANOME_AVAILABLE = False
 from core.data_manager import WorkLog
 from utils.date_utils import DateUtils
 
-@dataclass
+# 前処理用の連続空白
+_WS_RE = re.compile(r'\s+')
+
+# 「。」区切りの文（前後の空白を含まない）
+_SENT_RE = re.compile(r'[^。\s](?:[^。\n]*[^。\s])?')
+
+# キーポイント抽出用の句読点区切りの断片（前後の空白を含まない）
+_KEY_RE = re.compile(r'[^。、！？\s](?:[^。、！？\n]*[^。、！？\s])?')
+
+# slots指定はPython 3.10以降のみ対応
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SummaryResult:
     """要約結果データクラス"""
     summary_text: str
@@ -42,6 +56,9 @@ class SummaryResult:
 class Summarizer:
     """要約機能クラス（簡素化版）"""
     
+    # この文字数未満のテキストは要約せずそのまま返す
+    SHORT_TEXT_THRESHOLD = 200
+    
     def __init__(self, language: str = "japanese"):
         """
         初期化（簡素化版）
@@ -54,15 +71,16 @@ class Summarizer:
         
         # ストップワード取得（無効化）
         # try:
-        #     self.stop_words = get_stop_words(language)
+        #     self.stop_words = frozenset(get_stop_words(language))
         # except Exception:
         #     # 日本語ストップワードが利用できない場合はデフォルトの英語を使用
         #     try:
-        #         self.stop_words = get_stop_words("english")
+        #         self.stop_words = frozenset(get_stop_words("english"))
         #     except Exception:
         #         # それでもダメな場合は空のリストを使用
-        #         self.stop_words = []
-        self.stop_words = []
+        #         self.stop_words = frozenset()
+        # 所属判定をO(1)にするためfrozensetで保持
+        self.stop_words = frozenset()
         
         # 日本語形態素解析器（無効化）
         self.janome_tokenizer = None
@@ -106,9 +124,13 @@ class Summarizer:
                 created_at=DateUtils.get_now().isoformat()
             )
         
-        # 簡素化版：単純にテキストを分割して最初の部分を返す
-        summary_sentences = self._extract_summary(combined_text, method, sentences_count)
-        summary_text = "\n".join(summary_sentences)
+        if len(combined_text) < self.SHORT_TEXT_THRESHOLD:
+            # 短いテキストは要約しても意味がないため前処理だけ行って使う
+            summary_text = self._preprocess_text(combined_text)
+        else:
+            # 簡素化版：単純にテキストを分割して最初の部分を返す
+            summary_sentences = self._extract_summary(combined_text, method, sentences_count)
+            summary_text = "\n".join(summary_sentences)
         
         # キーポイント抽出
         key_points = self._extract_key_points(combined_text)
@@ -116,7 +138,8 @@ class Summarizer:
         # 統計情報計算
         original_count = len(combined_text)
         word_count = len(summary_text)
-        compression_ratio = (word_count / original_count) * 100 if original_count > 0 else 0
+        # 空テキストは先頭で返しているため original_count は必ず1以上
+        compression_ratio = word_count * 100.0 / original_count
         
         return SummaryResult(
             summary_text=summary_text,
@@ -138,21 +161,27 @@ class Summarizer:
         Returns:
             str: 結合されたテキスト
         """
-        combined_parts = []
+        buf = io.StringIO()
         
         for log in logs:
-            if log.content.strip():
-                # 日付情報を追加
-                log_date = DateUtils.parse_date(log.date)
-                if log_date:
-                    date_str = DateUtils.format_date_japanese(log_date)
-                    combined_parts.append(f"【{date_str}】")
-                
-                # 内容を追加
-                combined_parts.append(log.content.strip())
-                combined_parts.append("")  # 空行で区切り
+            content = log.content.strip()
+            if not content:
+                continue
+            if buf.tell():
+                buf.write("\n")  # 空行で区切り
+            
+            # 日付情報を追加
+            log_date = DateUtils.parse_date(log.date)
+            if log_date:
+                buf.write("【")
+                buf.write(DateUtils.format_date_japanese(log_date))
+                buf.write("】\n")
+            
+            # 内容を追加
+            buf.write(content)
+            buf.write("\n")
         
-        return "\n".join(combined_parts)
+        return buf.getvalue()
     
     def _extract_summary(self, text: str, method: str, sentences_count: int) -> List[str]:
         """
@@ -173,15 +202,16 @@ class Summarizer:
             if not cleaned_text.strip():
                 return ["要約するテキストがありません。"]
             
-            # 簡素化版：単純にテキストを分割して最初の部分を返す
-            sentences = cleaned_text.split('。')
-            sentences = [s.strip() for s in sentences if s.strip()]
-            
-            # 指定された数の文を返す
-            if len(sentences) <= sentences_count:
+            # 簡素化版：先頭から指定された数の文を返す（集まった時点で走査を打ち切る）
+            sentences = []
+            if sentences_count <= 0:
                 return sentences
-            else:
-                return sentences[:sentences_count]
+            for match in _SENT_RE.finditer(cleaned_text):
+                sentences.append(match.group())
+                if len(sentences) >= sentences_count:
+                    break
+            
+            return sentences
                 
         except Exception as e:
             print(f"要約処理エラー: {e}")
@@ -197,16 +227,8 @@ class Summarizer:
         Returns:
             str: 前処理済みテキスト
         """
-        # 改行を正規化
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # 連続する空白を単一の空白に変換
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 前後の空白を削除
-        text = text.strip()
-        
-        return text
+        # 改行を含む連続する空白を単一の空白に変換し、前後の空白を削除
+        return _WS_RE.sub(' ', text).strip()
     
     def _extract_key_points(self, text: str, max_points: int = 10) -> List[str]:
         """
@@ -239,17 +261,11 @@ class Summarizer:
             List[str]: キーポイントリスト
         """
         try:
-            # 句読点で分割
-            sentences = re.split(r'[。、！？\n]', text)
-            
-            # 空文字列を除去
-            sentences = [s.strip() for s in sentences if s.strip()]
-            
-            # 短い文をキーポイントとして扱う
+            # 句読点で区切った断片のうち、短い文をキーポイントとして扱う
             key_points = []
-            for sentence in sentences:
-                if 5 <= len(sentence) <= 50:  # 適度な長さの文
-                    key_points.append(sentence)
+            for match in _KEY_RE.finditer(text):
+                if 5 <= match.end() - match.start() <= 50:  # 適度な長さの文
+                    key_points.append(match.group())
                     if len(key_points) >= max_points:
                         break
             
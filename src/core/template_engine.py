@@ -3,16 +3,38 @@
 テンプレートエンジンクラス
 """
 
-import yaml
+import io
+import re
+import sys
+import functools
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from utils.file_utils import FileUtils
 from utils.date_utils import DateUtils
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """
+    yamlモジュールを初回使用時に読み込む
+    
+    Returns:
+        tuple: (yamlモジュール, ローダー, ダンパー)
+        LibYAMLが利用できればC実装のローダー・ダンパーを使う
+    """
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+# Python 3.10以降では__slots__付きのデータクラスにしてインスタンスを軽くする
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TemplateField:
     """テンプレートフィールドクラス"""
     name: str
@@ -21,29 +43,114 @@ class TemplateField:
     default: Any = None
     description: str = ""
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TemplateSection:
     """テンプレートセクションクラス"""
     name: str
     title: str
-    fields: List[TemplateField]
+    fields: Tuple[TemplateField, ...]
     order: int = 0
     visible: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Template:
     """テンプレートクラス"""
     id: str
     name: str
     description: str
-    sections: List[TemplateSection]
+    sections: Tuple[TemplateSection, ...]
     output_format: str
     created_at: str
     updated_at: str
 
+# ISO形式（YYYY-MM-DD...）の先頭部分
+_ISO_DATE_PREFIX_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+def _as_date(value: Any) -> Any:
+    """date型: YYYY-MM-DD を日本語表記に変換"""
+    if not isinstance(value, str):
+        return value
+    parsed_date = DateUtils.parse_date(value)
+    if parsed_date:
+        return DateUtils.format_date_japanese(parsed_date)
+    return value
+
+def _as_datetime(value: Any) -> Any:
+    """datetime型: ISO形式を日本語表記に変換"""
+    # ISO形式の日付で始まらない値は例外処理を通さずそのまま返す
+    if not isinstance(value, str) or not _ISO_DATE_PREFIX_RE.match(value):
+        return value
+    try:
+        dt = datetime.fromisoformat(value)
+        return dt.strftime("%Y年%m月%d日 %H:%M")
+    except ValueError:
+        return value
+
+def _as_list(value: Any) -> Any:
+    """list型: 箇条書きに変換"""
+    if not isinstance(value, list):
+        return value
+    items = [str(item) for item in value if item]
+    if not items:
+        return ""
+    return "• " + "\n• ".join(items)
+
+def _as_summary(value: Any) -> Any:
+    """summary型: 要約データから本文を取り出す"""
+    if not isinstance(value, dict):
+        return value
+    if "summary_text" in value:
+        return value["summary_text"]
+    elif "summary" in value:
+        return value["summary"]
+    return value
+
+# フィールド型 → 値の変換関数
+_FIELD_TYPE_HANDLERS = {
+    "date": _as_date,
+    "datetime": _as_datetime,
+    "list": _as_list,
+    "summary": _as_summary,
+}
+
 class TemplateEngine:
     """テンプレートエンジンクラス"""
     
+    # フィールドマッピング: テンプレートフィールド名 → 要約データフィールド名
+    _FIELD_MAPPING = {
+        'weekly_summary': 'summary_text',
+        'summary_text': 'summary_text',
+        'keywords': 'keywords',
+        'key_points': 'key_points',
+        'generated_at': 'generated_at',
+        'creation_date': 'generated_at',
+        'report_date': 'report_date',
+        'daily_summary': 'summary_text',
+        'monthly_summary': 'summary_text',
+        'key_achievements': 'summary_text',
+        'completed_tasks': 'summary_text',
+        'ongoing_tasks': 'summary_text',
+        'project_summary': 'summary_text',
+        'activity_summary': 'summary_text',
+        'progress_summary': 'summary_text',
+        'achievement_summary': 'summary_text',
+        'daily_details': 'daily_details',
+        'period_start': 'period_start',
+        'period_end': 'period_end',
+        'target_date': 'period_start',  # 日報の対象日は期間開始日を使用
+        'reporter_name': 'reporter_name',
+        'completed_items': 'completed_items',
+        'progress_items': 'progress_items'
+    }
+    
+    # テンプレート一括読み込み時の最大スレッド数
+    MAX_LOAD_WORKERS = 8
+    
+    # 必須未入力時に「指定なし」とする日付系フィールド
+    _DATE_RANGE_FIELDS = frozenset({
+        'week_start_date', 'week_end_date', 'period_start', 'period_end', 'target_date'
+    })
+    
     def __init__(self, templates_dir: Path):
         """
         初期化
@@ -54,8 +161,9 @@ class TemplateEngine:
         self.templates_dir = Path(templates_dir)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
         
-        # テンプレートキャッシュ
+        # テンプレートキャッシュ（template_id → (更新時刻, Template)）
         self.template_cache = {}
+        self._cache_lock = threading.Lock()
         
         # デフォルトテンプレートを作成
         self._create_default_templates()
@@ -90,24 +198,29 @@ class TemplateEngine:
         Returns:
             Optional[Template]: テンプレート（存在しない場合はNone）
         """
-        # キャッシュから確認
-        if template_id in self.template_cache:
-            return self.template_cache[template_id]
-        
-        # ファイルから読み込み
         template_file = self.templates_dir / f"{template_id}.yaml"
-        if not template_file.exists():
+        try:
+            mtime = template_file.stat().st_mtime_ns
+        except OSError:
             return None
         
+        # ファイルが更新されていなければキャッシュを返す
+        cached = self.template_cache.get(template_id)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        # ファイルから読み込み
         try:
             template_data = FileUtils.read_text_file(template_file)
-            template_config = yaml.safe_load(template_data)
+            yaml, loader, _ = _yaml()
+            template_config = yaml.load(template_data, Loader=loader)
             
             # テンプレートオブジェクトに変換
             template = self._parse_template_config(template_config)
             
             # キャッシュに保存
-            self.template_cache[template_id] = template
+            with self._cache_lock:
+                self.template_cache[template_id] = (mtime, template)
             
             return template
             
@@ -131,9 +244,10 @@ class TemplateEngine:
             # フィールドを解析
             fields = []
             for field_config in section_config.get("fields", []):
+                # 名前・型はデータ辞書のキー検索や比較に使うためインターンしておく
                 field = TemplateField(
-                    name=field_config["name"],
-                    type=field_config.get("type", "text"),
+                    name=sys.intern(field_config["name"]),
+                    type=sys.intern(field_config.get("type", "text")),
                     required=field_config.get("required", False),
                     default=field_config.get("default"),
                     description=field_config.get("description", "")
@@ -141,16 +255,17 @@ class TemplateEngine:
                 fields.append(field)
             
             section = TemplateSection(
-                name=section_config["name"],
-                title=section_config.get("title", section_config["name"]),
-                fields=fields,
+                name=sys.intern(section_config["name"]),
+                title=sys.intern(section_config.get("title", section_config["name"])),
+                fields=tuple(fields),
                 order=section_config.get("order", 0),
                 visible=section_config.get("visible", True)
             )
             sections.append(section)
         
-        # セクションを順序でソート
+        # セクションを順序でソート（解析後は変更しないためタプルで保持）
         sections.sort(key=lambda x: x.order)
+        sections = tuple(sections)
         
         return Template(
             id=config["id"],
@@ -170,11 +285,16 @@ class TemplateEngine:
             List[Dict[str, str]]: テンプレート情報リスト
         """
         templates = []
+        template_ids = [template_file.stem for template_file in self.templates_dir.glob("*.yaml")]
+        if not template_ids:
+            return templates
         
-        for template_file in self.templates_dir.glob("*.yaml"):
-            template_id = template_file.stem
-            template = self.load_template(template_id)
-            
+        # 各ファイルの読み込み・解析は独立しているため並列に行う
+        workers = min(self.MAX_LOAD_WORKERS, len(template_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(self.load_template, template_ids))
+        
+        for template in loaded:
             if template:
                 templates.append({
                     "id": template.id,
@@ -212,22 +332,20 @@ class TemplateEngine:
                 "sections": []
             }
             
-            for section in template.sections:
-                if not section.visible:
-                    continue
-                
-                section_data = {
+            visible_sections = [section for section in template.sections if section.visible]
+            if not visible_sections:
+                return result
+            
+            for section in visible_sections:
+                # フィールドにデータを適用
+                result["sections"].append({
                     "name": section.name,
                     "title": section.title,
-                    "content": {}
-                }
-                
-                # フィールドにデータを適用
-                for field in section.fields:
-                    field_value = self._get_field_value(field, data)
-                    section_data["content"][field.name] = field_value
-                
-                result["sections"].append(section_data)
+                    "content": {
+                        field.name: self._get_field_value(field, data)
+                        for field in section.fields
+                    }
+                })
             
             return result
             
@@ -245,35 +363,8 @@ class TemplateEngine:
         Returns:
             Any: フィールドの値
         """
-        # フィールドマッピング: テンプレートフィールド名 → 要約データフィールド名
-        field_mapping = {
-            'weekly_summary': 'summary_text',
-            'summary_text': 'summary_text',
-            'keywords': 'keywords',
-            'key_points': 'key_points',
-            'generated_at': 'generated_at',
-            'creation_date': 'generated_at',
-            'report_date': 'report_date',
-            'daily_summary': 'summary_text',
-            'monthly_summary': 'summary_text',
-            'key_achievements': 'summary_text',
-            'completed_tasks': 'summary_text',
-            'ongoing_tasks': 'summary_text',
-            'project_summary': 'summary_text',
-            'activity_summary': 'summary_text',
-            'progress_summary': 'summary_text',
-            'achievement_summary': 'summary_text',
-            'daily_details': 'daily_details',
-            'period_start': 'period_start',
-            'period_end': 'period_end',
-            'target_date': 'period_start',  # 日報の対象日は期間開始日を使用
-            'reporter_name': 'reporter_name',
-            'completed_items': 'completed_items',
-            'progress_items': 'progress_items'
-        }
-        
         # マッピングがあれば使用、なければ元のフィールド名を使用
-        mapped_field = field_mapping.get(field.name, field.name)
+        mapped_field = self._FIELD_MAPPING.get(field.name, field.name)
         
         # データから値を取得
         value = data.get(mapped_field, field.default)
@@ -281,7 +372,7 @@ class TemplateEngine:
         # 必須フィールドで値がない場合、デフォルト値を設定
         if field.required and (value is None or value == ""):
             # 特定のフィールドにはデフォルト値を設定
-            if field.name in ['week_start_date', 'week_end_date', 'period_start', 'period_end', 'target_date']:
+            if field.name in self._DATE_RANGE_FIELDS:
                 return "指定なし"
             elif field.name == 'reporter_name':
                 return "報告者名未設定"
@@ -292,42 +383,9 @@ class TemplateEngine:
             else:
                 return f"[必須フィールド '{field.name}' が未入力です]"
         
-        # 型に応じた処理
-        if field.type == "date":
-            if isinstance(value, str):
-                parsed_date = DateUtils.parse_date(value)
-                if parsed_date:
-                    return DateUtils.format_date_japanese(parsed_date)
-            return value
-        
-        elif field.type == "datetime":
-            if isinstance(value, str):
-                try:
-                    dt = datetime.fromisoformat(value)
-                    return dt.strftime("%Y年%m月%d日 %H:%M")
-                except ValueError:
-                    pass
-            return value
-        
-        elif field.type == "list":
-            if isinstance(value, list):
-                return "\n".join(f"• {item}" for item in value if item)
-            return value
-        
-        elif field.type == "summary":
-            # 要約データの特別処理
-            if isinstance(value, dict):
-                if "summary_text" in value:
-                    return value["summary_text"]
-                elif "summary" in value:
-                    return value["summary"]
-            return value
-        
-        elif field.type == "daily_content":
-            # 日別コンテンツの特別処理
-            return value
-        
-        return value
+        # 型に応じた処理（daily_content などハンドラのない型はそのまま返す）
+        handler = _FIELD_TYPE_HANDLERS.get(field.type)
+        return handler(value) if handler else value
     
     def format_output(self, template_result: Dict[str, Any], output_format: str = "text") -> str:
         """
@@ -349,26 +407,28 @@ class TemplateEngine:
     
     def _format_text(self, template_result: Dict[str, Any]) -> str:
         """テキスト形式で出力"""
-        lines = []
+        # 2行目以降は行頭に改行を書く（末尾に改行は付けない）
+        buf = io.StringIO()
+        w = buf.write
         
         # ヘッダー
-        lines.append(f"# {template_result.get('template_name', 'レポート')}")
-        lines.append(f"作成日時: {template_result.get('generated_at', '')}")
-        lines.append("")
+        w(f"# {template_result.get('template_name', 'レポート')}")
+        w(f"\n作成日時: {template_result.get('generated_at', '')}")
+        w("\n")
         
         # セクション
         for section in template_result.get("sections", []):
-            lines.append(f"## {section['title']}")
-            lines.append("")
+            w(f"\n## {section['title']}")
+            w("\n")
             
             for field_name, field_value in section["content"].items():
                 if field_value is not None and field_value != "":
                     # フィールド名を日本語に変換
                     display_name = self._get_field_display_name(field_name)
-                    lines.append(f"{display_name}: {field_value}")
-                    lines.append("")
+                    w(f"\n{display_name}: {field_value}")
+                    w("\n")
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     def _get_field_display_name(self, field_name: str) -> str:
         """フィールド名を日本語表示名に変換"""
@@ -401,45 +461,48 @@ class TemplateEngine:
     
     def _format_markdown(self, template_result: Dict[str, Any]) -> str:
         """Markdown形式で出力"""
-        lines = []
+        # 2行目以降は行頭に改行を書く（末尾に改行は付けない）
+        buf = io.StringIO()
+        w = buf.write
         
         # ヘッダー
-        lines.append(f"# {template_result.get('template_name', 'レポート')}")
-        lines.append(f"**作成日時**: {template_result.get('generated_at', '')}")
-        lines.append("")
+        w(f"# {template_result.get('template_name', 'レポート')}")
+        w(f"\n**作成日時**: {template_result.get('generated_at', '')}")
+        w("\n")
         
         # セクション
         for section in template_result.get("sections", []):
-            lines.append(f"## {section['title']}")
-            lines.append("")
+            w(f"\n## {section['title']}")
+            w("\n")
             
             for field_name, field_value in section["content"].items():
                 if field_value is not None and field_value != "":
-                    lines.append(f"**{field_name}**:")
-                    lines.append(f"{field_value}")
-                    lines.append("")
+                    w(f"\n**{field_name}**:")
+                    w(f"\n{field_value}")
+                    w("\n")
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     def _format_html(self, template_result: Dict[str, Any]) -> str:
         """HTML形式で出力"""
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
         
-        lines.append("<html><head><meta charset='utf-8'></head><body>")
-        lines.append(f"<h1>{template_result.get('template_name', 'レポート')}</h1>")
-        lines.append(f"<p><strong>作成日時</strong>: {template_result.get('generated_at', '')}</p>")
+        w("<html><head><meta charset='utf-8'></head><body>\n")
+        w(f"<h1>{template_result.get('template_name', 'レポート')}</h1>\n")
+        w(f"<p><strong>作成日時</strong>: {template_result.get('generated_at', '')}</p>\n")
         
         # セクション
         for section in template_result.get("sections", []):
-            lines.append(f"<h2>{section['title']}</h2>")
+            w(f"<h2>{section['title']}</h2>\n")
             
             for field_name, field_value in section["content"].items():
                 if field_value is not None and field_value != "":
-                    lines.append(f"<p><strong>{field_name}</strong>: {field_value}</p>")
+                    w(f"<p><strong>{field_name}</strong>: {field_value}</p>\n")
         
-        lines.append("</body></html>")
+        w("</body></html>")
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     def save_template(self, template: Template) -> bool:
         """
@@ -484,14 +547,16 @@ class TemplateEngine:
                 
                 template_dict["sections"].append(section_dict)
             
-            # ファイルに保存
+            # ファイルに保存（文字列を経由せず直接書き込む）
             template_file = self.templates_dir / f"{template.id}.yaml"
-            yaml_content = yaml.dump(template_dict, default_flow_style=False,
-                                   allow_unicode=True, sort_keys=False)
-            FileUtils.write_text_file(template_file, yaml_content)
+            yaml, _, dumper = _yaml()
+            with open(template_file, 'w', encoding='utf-8') as file:
+                yaml.dump(template_dict, file, Dumper=dumper,
+                          default_flow_style=False, allow_unicode=True, sort_keys=False)
             
             # キャッシュを更新
-            self.template_cache[template.id] = template
+            with self._cache_lock:
+                self.template_cache[template.id] = (template_file.stat().st_mtime_ns, template)
             
             return True
             
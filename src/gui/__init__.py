@@ -3,11 +3,16 @@
 ドキュメント自動要約&作成アプリ - GUI パッケージ
 """
 
-from .main_window import MainWindow
-from .log_input import LogInputWidget
-from .template_selector import TemplateSelectorWidget
-from .summary_view import SummaryViewWidget
-from .output_config import OutputConfigWidget
+import importlib
+
+# 公開クラス名 → サブモジュール名（初回アクセス時に読み込む）
+_MODULE_MAP = {
+    'MainWindow': 'main_window',
+    'LogInputWidget': 'log_input',
+    'TemplateSelectorWidget': 'template_selector',
+    'SummaryViewWidget': 'summary_view',
+    'OutputConfigWidget': 'output_config'
+}
 
 __all__ = [
     'MainWindow',
@@ -15,4 +20,14 @@ __all__ = [
     'TemplateSelectorWidget',
     'SummaryViewWidget',
     'OutputConfigWidget'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """公開クラスを遅延インポート（PEP 562）"""
+    if name in _MODULE_MAP:
+        module = importlib.import_module('.' + _MODULE_MAP[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,25 +3,164 @@
 ログ入力ウィジェット
 """
 
-from datetime import date
+import re
+import functools
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Callable, List, Optional
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QTextEdit, QPushButton, QDateEdit, QLineEdit,
-                             QComboBox, QListWidget, QListWidgetItem,
+                             QComboBox, QListView,
                              QMessageBox, QSplitter, QGroupBox, QFrame, QCheckBox)
-from PySide6.QtCore import Qt, QDate, Signal, QTimer
-from PySide6.QtGui import QTextCharFormat, QColor
+from PySide6.QtCore import (Qt, QDate, QThread, Signal, QTimer,
+                            QAbstractListModel, QModelIndex)
+from PySide6.QtGui import QTextCharFormat, QColor, QBrush, QTextCursor
 
-from core.data_manager import DataManager
+from core.data_manager import DataManager, WorkLog
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 from utils.date_utils import DateUtils
 from gui.widgets import LogPreviewWidget, LogStatisticsWidget, ProgressWidget
 
+def _qdate(d: date) -> QDate:
+    """
+    dateをQDateに変換（文字列を経由しない）
+    
+    Args:
+        d: 変換する日付
+        
+    Returns:
+        QDate: 変換後の日付
+    """
+    return QDate(d.year, d.month, d.day)
+
+# タグ入力の区切り（前後の空白もまとめて除く）
+_TAG_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# QTextCursor.selectedText()の区切り文字をtoPlainText()と同じ表現に揃える変換表
+_SELECTED_TEXT_TABLE = str.maketrans({"\u2029": "\n", "\u2028": "\n", "\u00a0": " "})
+
+@functools.lru_cache(maxsize=1)
+def _current_date_brush() -> QBrush:
+    """
+    履歴で現在の日付を強調表示するブラシを取得（QApplication生成後に初回作成）
+    
+    Returns:
+        QBrush: 背景ブラシ
+    """
+    return QBrush(QColor("#E3F2FD"))
+
+class LogSaveWorker(QThread):
+    """ログ保存ワーカー"""
+    
+    save_completed = Signal(bool)
+    error_occurred = Signal(str)
+    
+    def __init__(self, data_manager: DataManager, log_date: date, content: str,
+                 tags: List[str], manual: bool):
+        super().__init__()
+        self.data_manager = data_manager
+        self.log_date = log_date
+        self.content = content
+        self.tags = tags
+        self.manual = manual
+        
+    def run(self):
+        """保存処理を実行"""
+        try:
+            success = self.data_manager.save_work_log(self.log_date, self.content, self.tags)
+            self.save_completed.emit(success)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+class LogHistoryModel(QAbstractListModel):
+    """ログ履歴モデル（表示される行のログだけを読み込む）"""
+    
+    # 履歴に表示する作業内容の先頭文字数
+    PREVIEW_LENGTH = 50
+    
+    def __init__(self, loader: Callable[[date], Optional[WorkLog]], parent=None):
+        """
+        初期化
+        
+        Args:
+            loader: 日付から作業ログを読み込む関数
+            parent: 親オブジェクト
+        """
+        super().__init__(parent)
+        self._loader = loader
+        self._dates: List[date] = []
+        self._current_date: Optional[date] = None
+    
+    def set_dates(self, dates: List[date], current_date: date):
+        """
+        表示する日付を設定
+        
+        Args:
+            dates: ログの日付リスト（表示順）
+            current_date: 強調表示する日付
+        """
+        # 日付が変わらなければリセットせず、1回の通知で表示だけ更新する（スクロール位置も保たれる）
+        if dates == self._dates:
+            self._current_date = current_date
+            if dates:
+                self.dataChanged.emit(self.index(0), self.index(len(dates) - 1))
+            return
+        
+        self.beginResetModel()
+        self._dates = dates
+        self._current_date = current_date
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """行数を取得"""
+        return 0 if parent.isValid() else len(self._dates)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """表示データを取得"""
+        if not index.isValid():
+            return None
+        
+        log_date = self._dates[index.row()]
+        
+        if role == Qt.DisplayRole:
+            date_str = DateUtils.format_date_japanese(log_date)
+            log = self._loader(log_date)
+            if not log:
+                return date_str
+            preview = log.content[:self.PREVIEW_LENGTH] + ("..." if len(log.content) > self.PREVIEW_LENGTH else "")
+            return f"{date_str}\n{preview}"
+        
+        if role == Qt.UserRole:
+            return DateUtils.format_date(log_date)
+        
+        # 現在の日付は強調表示
+        if role == Qt.BackgroundRole and log_date == self._current_date:
+            return _current_date_brush()
+        
+        return None
+
 class LogInputWidget(QWidget):
     """ログ入力ウィジェット"""
     
     log_saved = Signal(str, bool)  # 日付, 成功フラグ
     
+    # プレビューに表示する先頭文字数と、入力中のプレビュー更新待ち時間（ミリ秒）
+    PREVIEW_LENGTH = 500
+    PREVIEW_DELAY_MS = 150
+    
+    # 読み込み済みログのキャッシュ最大件数
+    LOG_CACHE_SIZE = 64
+    
+    # 最近のログに表示する件数
+    HISTORY_SIZE = 10
+    
+    # 自動保存を書き込むまでの待ち時間（ミリ秒）
+    SAVE_FLUSH_DELAY_MS = 500
+    
+    # 日付変更を反映するまでの待ち時間（ミリ秒）
+    DATE_CHANGE_DELAY_MS = 100
+    
     def __init__(self, data_manager: DataManager, config_manager: ConfigManager, logger: Logger):
         """
         初期化
@@ -38,9 +177,48 @@ class LogInputWidget(QWidget):
         self.logger = logger
         
         self.current_date = date.today()
+        
+        # 統計情報の更新待ち（非表示中に要求された場合）
+        self._stats_dirty = False
+        
+        # 日付移動中の変更先（タイマー満了時に反映する）
+        self._pending_date = None
+        self.date_change_timer = QTimer()
+        self.date_change_timer.setSingleShot(True)
+        self.date_change_timer.timeout.connect(self.apply_date_change)
+        
+        # 読み込み済みログ（日付 → WorkLog、存在しない日はNone）とログ日付一覧のキャッシュ
+        # このウィジェットからの保存時に破棄する
+        self._log_cache = OrderedDict()
+        self._log_dates = None
+        
+        # 保存はワーカースレッドで1件ずつ行う
+        # 保存待ちは日付ごとにまとめ（日付 → (作業内容, タグ, 手動保存か)）、自動保存は少し待ってから書き込む
+        self.save_worker = None
+        self._save_queue = OrderedDict()
+        self.flush_timer = QTimer()
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush_save_queue)
+        
+        # 自動保存は一定間隔のタイマーで行い、前回から編集があった場合だけ保存する
+        self._dirty = False
+        
+        # 保存済み内容（作業内容, タグ）のハッシュ
+        self._saved_hash = hash(("", ()))
+        
+        # 直前に分割したタグ入力（入力文字列, タグリスト）
+        self._tags_cache = ("", [])
+        
         self.auto_save_timer = QTimer()
         self.auto_save_timer.timeout.connect(self.auto_save)
         
+        # 文字数はドキュメントから都度取得し、プレビューは入力が落ち着いてから更新する
+        self._char_count = 0
+        self._content_text = ""
+        self.preview_timer = QTimer()
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.timeout.connect(self.update_preview)
+        
         self.setup_ui()
         self.setup_connections()
         self.load_current_log()
@@ -61,6 +239,9 @@ class LogInputWidget(QWidget):
         
         # スプリッターの初期サイズ
         splitter.setSizes([600, 400])
+        
+        # 折りたたまれていた統計情報が表示されたら更新する
+        splitter.splitterMoved.connect(self.refresh_statistics_if_needed)
     
     def create_input_area(self, parent):
         """入力エリアを作成"""
@@ -76,7 +257,7 @@ class LogInputWidget(QWidget):
         date_layout.addWidget(QLabel("日付:"))
         
         self.date_edit = QDateEdit()
-        self.date_edit.setDate(QDate.fromString(DateUtils.format_date(self.current_date), "yyyy-MM-dd"))
+        self.date_edit.setDate(_qdate(self.current_date))
         self.date_edit.setCalendarPopup(True)
         self.date_edit.dateChanged.connect(self.on_date_changed)
         date_layout.addWidget(self.date_edit)
@@ -103,6 +284,7 @@ class LogInputWidget(QWidget):
         
         self.tag_input = QLineEdit()
         self.tag_input.setPlaceholderText("タグをカンマ区切りで入力（例：会議,開発,レビュー）")
+        self.tag_input.textEdited.connect(self.on_tags_edited)
         tag_layout.addWidget(self.tag_input)
         
         header_layout.addLayout(tag_layout)
@@ -122,7 +304,7 @@ class LogInputWidget(QWidget):
             "- バグ修正: ログイン機能の不具合を解決\n"
             "- コードレビュー: 新機能の実装をチェック"
         )
-        self.content_edit.textChanged.connect(self.on_content_changed)
+        self.content_edit.document().contentsChange.connect(self.on_content_changed)
         content_layout.addWidget(self.content_edit)
         
         # 文字数表示
@@ -173,8 +355,12 @@ class LogInputWidget(QWidget):
         history_group = QGroupBox("最近のログ")
         history_layout = QVBoxLayout(history_group)
         
-        self.log_history = QListWidget()
-        self.log_history.itemClicked.connect(self.on_history_selected)
+        # 行の高さを揃えて、スクロールで表示された行だけデータを取得させる
+        self.history_model = LogHistoryModel(self._cached_load, self)
+        self.log_history = QListView()
+        self.log_history.setUniformItemSizes(True)
+        self.log_history.setModel(self.history_model)
+        self.log_history.clicked.connect(self.on_history_selected)
         history_layout.addWidget(self.log_history)
         
         layout.addWidget(history_group)
@@ -199,11 +385,16 @@ class LogInputWidget(QWidget):
         self.toggle_auto_save(Qt.Checked)
     
     def on_date_changed(self, q_date):
-        """日付変更時の処理"""
-        new_date = q_date.toPython()
-        if new_date != self.current_date:
+        """日付変更時の処理（連続した日付移動はまとめて最後の日付だけ読み込む）"""
+        self._pending_date = q_date.toPython()
+        self.date_change_timer.start(self.DATE_CHANGE_DELAY_MS)
+    
+    def apply_date_change(self):
+        """保留中の日付変更を反映"""
+        new_date, self._pending_date = self._pending_date, None
+        if new_date is not None and new_date != self.current_date:
             # 現在のログを保存確認
-            if self.content_edit.toPlainText().strip() and self.has_unsaved_changes():
+            if self._content_text.strip() and self.has_unsaved_changes():
                 reply = QMessageBox.question(
                     self, 
                     "未保存の変更",
@@ -215,39 +406,100 @@ class LogInputWidget(QWidget):
                     self.save_log()
                 elif reply == QMessageBox.Cancel:
                     # 日付変更をキャンセル
-                    self.date_edit.setDate(QDate.fromString(DateUtils.format_date(self.current_date), "yyyy-MM-dd"))
+                    self.date_edit.setDate(_qdate(self.current_date))
                     return
             
             self.current_date = new_date
             self.load_current_log()
             self.update_log_history()
     
-    def on_content_changed(self):
-        """コンテンツ変更時の処理"""
-        content = self.content_edit.toPlainText()
-        char_count = len(content)
-        self.char_count_label.setText(f"文字数: {char_count:,}")
+    def on_content_changed(self, position, chars_removed, chars_added):
+        """
+        コンテンツ変更時の処理
         
-        # プレビュー更新
-        self.preview_widget.set_preview_text(content[:500] + ("..." if len(content) > 500 else ""))
+        Args:
+            position: 変更位置
+            chars_removed: 削除された文字数
+            chars_added: 追加された文字数
+        """
+        # 全文をコピーせずにドキュメントの文字数から求める（末尾の段落区切りを除く）
+        previous_count = self._char_count
+        self._char_count = max(0, self.content_edit.document().characterCount() - 1)
+        self.char_count_label.setText(f"文字数: {self._char_count:,}")
+        
+        # 作業内容の文字列は変更箇所だけ差し替える
+        self._splice_content_text(position, chars_removed, chars_added)
         
-        # 自動保存タイマーリセット
-        if self.auto_save_timer.isActive():
-            self.auto_save_timer.start(30000)  # 30秒後に自動保存
+        # プレビュー範囲内の変更か、省略記号の有無が変わる場合だけプレビューを更新
+        limit = self.PREVIEW_LENGTH
+        if position < limit or (previous_count > limit) != (self._char_count > limit):
+            self.preview_timer.start(self.PREVIEW_DELAY_MS)
+        
+        # 自動保存の対象にする（タイマーは入力ごとにリセットしない）
+        self._dirty = True
     
-    def on_history_selected(self, item):
+    def _splice_content_text(self, position, chars_removed, chars_added):
+        """
+        保持している作業内容の文字列に変更箇所を反映
+        
+        Args:
+            position: 変更位置
+            chars_removed: 削除された文字数
+            chars_added: 追加された文字数
+        """
+        document = self.content_edit.document()
+        cursor = QTextCursor(document)
+        cursor.setPosition(min(position, self._char_count))
+        cursor.setPosition(min(position + chars_added, self._char_count), QTextCursor.KeepAnchor)
+        added_text = cursor.selectedText().translate(_SELECTED_TEXT_TABLE)
+        
+        text = self._content_text
+        self._content_text = text[:position] + added_text + text[position + chars_removed:]
+        
+        # setPlainText()などは末尾の段落区切りを含めて通知されるため、長さが合わなければ全体を取り直す
+        if len(self._content_text) != self._char_count:
+            self._content_text = document.toPlainText()
+    
+    def _current_tags(self) -> List[str]:
+        """
+        タグ入力をタグリストに分割
+        
+        Returns:
+            List[str]: タグリスト
+        """
+        text = self.tag_input.text()
+        if text != self._tags_cache[0]:
+            self._tags_cache = (text, [tag for tag in _TAG_SPLIT_RE.split(text.strip()) if tag])
+        return list(self._tags_cache[1])
+    
+    def on_tags_edited(self, text):
+        """タグ編集時の処理"""
+        self._dirty = True
+    
+    def update_preview(self):
+        """作業内容の先頭部分でプレビューを更新"""
+        cursor = QTextCursor(self.content_edit.document())
+        cursor.setPosition(min(self._char_count, self.PREVIEW_LENGTH), QTextCursor.KeepAnchor)
+        
+        # selectedText()は改行を段落区切り文字で返すため置き換える
+        text = cursor.selectedText().translate(_SELECTED_TEXT_TABLE)
+        if self._char_count > self.PREVIEW_LENGTH:
+            text += "..."
+        self.preview_widget.set_preview_text(text)
+    
+    def on_history_selected(self, index):
         """履歴選択時の処理"""
-        date_str = item.data(Qt.UserRole)
+        date_str = index.data(Qt.UserRole)
         if date_str:
             selected_date = DateUtils.parse_date(date_str)
             if selected_date:
                 self.current_date = selected_date
-                self.date_edit.setDate(QDate.fromString(date_str, "yyyy-MM-dd"))
+                self.date_edit.setDate(_qdate(selected_date))
                 self.load_current_log()
     
     def load_current_log(self):
         """現在の日付のログを読み込み"""
-        log = self.data_manager.load_work_log(self.current_date)
+        log = self._cached_load(self.current_date)
         
         if log:
             self.content_edit.setPlainText(log.content)
@@ -258,55 +510,163 @@ class LogInputWidget(QWidget):
             self.tag_input.clear()
             self.logger.log_operation(f"新規ログ作成: {self.current_date}")
         
-        # プレビューを更新
-        self.preview_widget.set_preview_text(self.content_edit.toPlainText())
+        # プレビューを更新（入力中の遅延更新は不要）
+        self.preview_timer.stop()
+        self.update_preview()
+        
+        # 読み込んだ内容は保存済みとして扱う
+        if log:
+            self._saved_hash = hash((log.content.strip(), tuple(log.tags)))
+        else:
+            self._saved_hash = hash(("", ()))
+        self._dirty = False
     
     def save_log(self):
         """ログを保存"""
-        content = self.content_edit.toPlainText().strip()
-        tags = [tag.strip() for tag in self.tag_input.text().split(",") if tag.strip()]
+        content = self._content_text.strip()
+        tags = self._current_tags()
         
         if not content:
             QMessageBox.warning(self, "警告", "作業内容が入力されていません。")
             return
         
-        try:
-            self.progress_widget.start_progress("保存中...")
-            
-            success = self.data_manager.save_work_log(self.current_date, content, tags)
-            
-            if success:
-                self.progress_widget.finish_progress("保存完了")
-                self.log_saved.emit(DateUtils.format_date(self.current_date), True)
-                self.update_log_history()
-                self.update_statistics()
-                QMessageBox.information(self, "成功", "ログが正常に保存されました。")
-            else:
-                self.progress_widget.finish_progress("保存失敗")
-                self.log_saved.emit(DateUtils.format_date(self.current_date), False)
-                QMessageBox.critical(self, "エラー", "ログの保存に失敗しました。")
-                
-        except Exception as e:
-            self.progress_widget.finish_progress("保存失敗")
-            self.logger.log_error(e, "ログ保存")
-            QMessageBox.critical(self, "エラー", f"保存中にエラーが発生しました: {str(e)}")
+        self.progress_widget.start_progress("保存中...")
+        self._dirty = False
+        
+        # 手動保存は待たずに書き込む
+        self.enqueue_save(self.current_date, content, tags, manual=True)
+        self.flush_save_queue()
     
     def auto_save(self):
         """自動保存"""
-        content = self.content_edit.toPlainText().strip()
-        if content and self.has_unsaved_changes():
-            tags = [tag.strip() for tag in self.tag_input.text().split(",") if tag.strip()]
-            success = self.data_manager.save_work_log(self.current_date, content, tags)
-            
+        if not self.has_unsaved_changes():
+            self._dirty = False
+            return
+        
+        content = self._content_text.strip()
+        if content:
+            tags = self._current_tags()
+            self._dirty = False
+            self.enqueue_save(self.current_date, content, tags, manual=False)
+            self.flush_timer.start(self.SAVE_FLUSH_DELAY_MS)
+    
+    def enqueue_save(self, log_date: date, content: str, tags: List[str], manual: bool):
+        """
+        保存待ちに追加（同じ日付の保存待ちは新しい内容で置き換える）
+        
+        Args:
+            log_date: ログの日付
+            content: 作業内容
+            tags: タグリスト
+            manual: 手動保存かどうか
+        """
+        queued = self._save_queue.pop(log_date, None)
+        if queued is not None:
+            manual = manual or queued[2]
+        self._save_queue[log_date] = (content, tags, manual)
+        
+        # 書き込み前の古い内容をキャッシュから返さないよう、この時点で破棄する
+        self._invalidate_log_cache(log_date)
+    
+    def flush_save_queue(self):
+        """保存待ちの先頭をワーカーで保存（残りは完了後に続けて保存）"""
+        # ワーカーは完了通知を処理し終えるまで保持する（完了時の処理が対象のワーカーを参照するため）
+        if not self._save_queue or self.save_worker is not None:
+            return
+        
+        log_date, (content, tags, manual) = self._save_queue.popitem(last=False)
+        self.save_worker = LogSaveWorker(self.data_manager, log_date, content, tags, manual)
+        self.save_worker.save_completed.connect(self.on_save_completed)
+        self.save_worker.error_occurred.connect(self.on_save_error)
+        self.save_worker.finished.connect(self.on_save_worker_finished)
+        self.save_worker.start()
+    
+    def on_save_worker_finished(self):
+        """保存ワーカー終了時の処理"""
+        # finishedの通知中はスレッドがまだ終了処理中のため、終了を待ってから参照を手放し、
+        # 破棄はイベントループに任せる（実行中のQThreadを破棄しないように）
+        worker = self.save_worker
+        self.save_worker = None
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        self.flush_save_queue()
+    
+    def wait_for_save(self):
+        """実行中・保存待ちの保存が終わるまで待機（終了時用）"""
+        self.flush_timer.stop()
+        if self.save_worker is not None:
+            self.save_worker.wait()
+        
+        # 保存待ちはイベントループを待たずにその場で保存する
+        while self._save_queue:
+            log_date, (content, tags, _) = self._save_queue.popitem(last=False)
+            self.data_manager.save_work_log(log_date, content, tags)
+    
+    def on_save_completed(self, success: bool):
+        """
+        保存完了時の処理
+        
+        Args:
+            success: 保存に成功したかどうか
+        """
+        worker = self.save_worker
+        self._invalidate_log_cache(worker.log_date)
+        
+        # 成功したら保存済み内容を更新し、失敗した場合は次回の自動保存で再試行する
+        if worker.log_date == self.current_date:
+            if success:
+                self._saved_hash = hash((worker.content, tuple(worker.tags)))
+            else:
+                self._dirty = True
+        
+        if not worker.manual:
             if success:
-                self.logger.log_operation(f"自動保存: {self.current_date}")
-                # ステータス表示（控えめに）
-                self.char_count_label.setText(f"文字数: {len(content):,} (自動保存済み)")
-                QTimer.singleShot(2000, lambda: self.char_count_label.setText(f"文字数: {len(content):,}"))
+                self.logger.log_operation(f"自動保存: {worker.log_date}")
+                self.show_save_status("自動保存済み")
+            return
+        
+        if success:
+            self.progress_widget.finish_progress("保存完了")
+            self.log_saved.emit(DateUtils.format_date(worker.log_date), True)
+            self.update_log_history()
+            self.update_statistics()
+            self.show_save_status("保存済み")
+        else:
+            self.progress_widget.finish_progress("保存失敗")
+            self.log_saved.emit(DateUtils.format_date(worker.log_date), False)
+            QMessageBox.critical(self, "エラー", "ログの保存に失敗しました。")
+    
+    def show_save_status(self, status: str):
+        """
+        文字数表示の横に保存状態を一時的に表示（ステータス表示は控えめに）
+        
+        Args:
+            status: 表示する保存状態
+        """
+        self.char_count_label.setText(f"文字数: {self._char_count:,} ({status})")
+        QTimer.singleShot(2000, lambda: self.char_count_label.setText(f"文字数: {self._char_count:,}"))
+    
+    def on_save_error(self, error_message: str):
+        """
+        保存エラー時の処理
+        
+        Args:
+            error_message: エラーメッセージ
+        """
+        worker = self.save_worker
+        self._invalidate_log_cache(worker.log_date)
+        if worker.log_date == self.current_date:
+            self._dirty = True
+        self.logger.log_error(error_message, "ログ保存")
+        
+        if worker.manual:
+            self.progress_widget.finish_progress("保存失敗")
+            QMessageBox.critical(self, "エラー", f"保存中にエラーが発生しました: {error_message}")
     
     def clear_content(self):
         """コンテンツをクリア"""
-        if self.content_edit.toPlainText().strip():
+        if self._content_text.strip():
             reply = QMessageBox.question(
                 self,
                 "確認",
@@ -322,7 +682,7 @@ class LogInputWidget(QWidget):
     def copy_previous_log(self):
         """前日のログをコピー"""
         previous_date = DateUtils.get_previous_business_day(self.current_date)
-        previous_log = self.data_manager.load_work_log(previous_date)
+        previous_log = self._cached_load(previous_date)
         
         if previous_log:
             reply = QMessageBox.question(
@@ -346,19 +706,18 @@ class LogInputWidget(QWidget):
     
     def go_previous_day(self):
         """前日に移動"""
-        previous_date = self.current_date.replace(day=self.current_date.day-1) if self.current_date.day > 1 else self.current_date
-        if previous_date != self.current_date:
-            self.date_edit.setDate(QDate.fromString(DateUtils.format_date(previous_date), "yyyy-MM-dd"))
+        # 反映待ちの移動も数えるため日付入力の値を基準にする
+        self.date_edit.setDate(self.date_edit.date().addDays(-1))
     
     def go_today(self):
         """今日に移動"""
         today = date.today()
-        self.date_edit.setDate(QDate.fromString(DateUtils.format_date(today), "yyyy-MM-dd"))
+        self.date_edit.setDate(_qdate(today))
     
     def go_next_day(self):
         """翌日に移動"""
-        next_date = self.current_date.replace(day=self.current_date.day+1)
-        self.date_edit.setDate(QDate.fromString(DateUtils.format_date(next_date), "yyyy-MM-dd"))
+        # 反映待ちの移動も数えるため日付入力の値を基準にする
+        self.date_edit.setDate(self.date_edit.date().addDays(1))
     
     def toggle_auto_save(self, state):
         """自動保存の切り替え"""
@@ -367,31 +726,86 @@ class LogInputWidget(QWidget):
         else:
             self.auto_save_timer.stop()
     
-    def update_log_history(self):
-        """ログ履歴を更新"""
-        self.log_history.clear()
+    def _cached_load(self, log_date):
+        """
+        キャッシュを経由して作業ログを読み込み
         
-        # 最近のログ日付を取得
-        recent_dates = self.data_manager.get_all_log_dates()[-10:]  # 最新10件
-        recent_dates.reverse()  # 新しい順に並べ替え
+        Args:
+            log_date: ログの日付
+            
+        Returns:
+            Optional[WorkLog]: 作業ログ（存在しない場合はNone）
+        """
+        # 保存待ち・保存中の内容はディスクより新しいため優先する
+        pending_log = self._pending_log(log_date)
+        if pending_log is not None:
+            return pending_log
+        
+        if log_date in self._log_cache:
+            self._log_cache.move_to_end(log_date)
+            return self._log_cache[log_date]
+        
+        log = self.data_manager.load_work_log(log_date)
+        self._log_cache[log_date] = log
+        while len(self._log_cache) > self.LOG_CACHE_SIZE:
+            self._log_cache.popitem(last=False)
+        return log
+    
+    def _pending_log(self, log_date):
+        """
+        保存待ち・保存中の内容から作業ログを作成
         
-        for log_date in recent_dates:
-            log = self.data_manager.load_work_log(log_date)
-            if log:
-                date_str = DateUtils.format_date_japanese(log_date)
-                preview = log.content[:50] + ("..." if len(log.content) > 50 else "")
-                
-                item = QListWidgetItem(f"{date_str}\n{preview}")
-                item.setData(Qt.UserRole, DateUtils.format_date(log_date))
-                
-                # 現在の日付は強調表示
-                if log_date == self.current_date:
-                    item.setBackground(QColor("#E3F2FD"))
-                
-                self.log_history.addItem(item)
+        Args:
+            log_date: ログの日付
+            
+        Returns:
+            Optional[WorkLog]: 作業ログ（保存待ち・保存中でない場合はNone）
+        """
+        if log_date in self._save_queue:
+            content, tags, _ = self._save_queue[log_date]
+        elif self.save_worker is not None and self.save_worker.log_date == log_date:
+            content, tags = self.save_worker.content, self.save_worker.tags
+        else:
+            return None
+        
+        now = datetime.now().isoformat()
+        return WorkLog(date=DateUtils.format_date(log_date), content=content,
+                       created_at=now, updated_at=now, tags=list(tags))
+    
+    def _cached_log_dates(self):
+        """
+        キャッシュを経由して最近のログ日付を取得
+        
+        Returns:
+            List[date]: 最新HISTORY_SIZE件のログ日付（新しい順、変更しないこと）
+        """
+        if self._log_dates is None:
+            self._log_dates = self.data_manager.get_recent_log_dates(self.HISTORY_SIZE)
+        return self._log_dates
+    
+    def _invalidate_log_cache(self, log_date):
+        """
+        保存した日付のログキャッシュとログ日付一覧を破棄
+        
+        Args:
+            log_date: 保存したログの日付
+        """
+        self._log_cache.pop(log_date, None)
+        self._log_dates = None
+    
+    def update_log_history(self):
+        """ログ履歴を更新"""
+        # 最新HISTORY_SIZE件を表示し、ログ本文は表示時にモデルが読み込む
+        self.history_model.set_dates(self._cached_log_dates(), self.current_date)
     
     def update_statistics(self):
         """統計情報を更新"""
+        # 表示されていなければ集計せず、表示されたときに更新する
+        if not self.statistics_widget.isVisible():
+            self._stats_dirty = True
+            return
+        self._stats_dirty = False
+        
         stats = self.data_manager.get_statistics()
         
         # 表示用に整形
@@ -405,17 +819,27 @@ class LogInputWidget(QWidget):
         
         self.statistics_widget.update_statistics(display_stats)
     
+    def refresh_statistics_if_needed(self):
+        """保留中の統計情報の更新を表示中であれば実行"""
+        if self._stats_dirty and self.statistics_widget.isVisible():
+            self.update_statistics()
+    
+    def showEvent(self, event):
+        """表示イベント"""
+        super().showEvent(event)
+        
+        # 子ウィジェットの表示が確定してから判定する
+        QTimer.singleShot(0, self.refresh_statistics_if_needed)
+    
     def has_unsaved_changes(self):
         """未保存の変更があるかチェック"""
-        current_log = self.data_manager.load_work_log(self.current_date)
-        current_content = self.content_edit.toPlainText().strip()
-        current_tags = [tag.strip() for tag in self.tag_input.text().split(",") if tag.strip()]
+        # 読み込み・保存以降に編集していなければ比較は不要
+        if not self._dirty:
+            return False
         
-        if current_log:
-            return (current_content != current_log.content.strip() or 
-                   current_tags != current_log.tags)
-        else:
-            return bool(current_content)
+        current_content = self._content_text.strip()
+        current_tags = self._current_tags()
+        return hash((current_content, tuple(current_tags))) != self._saved_hash
     
     def new_log(self):
         """新規ログ作成"""
@@ -21,9 +21,24 @@ from core.llm_processor import LLMProcessor
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 
+# バージョン情報ダイアログの本文（2024年時点）
+_ABOUT_TEXT = """
+        {app_name}
+        
+        バージョン: {version}
+        
+        このアプリケーションは作業ログを自動的に要約し、
+        各種レポート形式で出力することができます。
+        
+        © 2024 Auto Make Document Team
+        """
+
 class MainWindow(QMainWindow):
     """メインウィンドウクラス"""
     
+    # タブの表示名（ステータスバー・操作ログ用）
+    TAB_NAMES = ("ログ入力", "テンプレート選択", "出力設定")
+    
     def __init__(self, config_manager: ConfigManager, logger: Logger, app_dir: Path):
         """
         初期化
@@ -370,24 +385,17 @@ class MainWindow(QMainWindow):
     def show_about(self):
         """バージョン情報表示"""
         app_config = self.config_manager.get_app_config()
-        about_text = f"""
-        {app_config.get('app_name', 'ドキュメント自動要約&作成アプリ')}
-        
-        バージョン: {app_config.get('version', '1.0.0')}
-        
-        このアプリケーションは作業ログを自動的に要約し、
-        各種レポート形式で出力することができます。
-        
-        © 2024 Auto Make Document Team
-        """
+        about_text = _ABOUT_TEXT.format(
+            app_name=app_config.get('app_name', 'ドキュメント自動要約&作成アプリ'),
+            version=app_config.get('version', '1.0.0')
+        )
         QMessageBox.about(self, "バージョン情報", about_text)
     
     def on_tab_changed(self, index):
         """タブ変更時の処理"""
-        tab_names = ["ログ入力", "テンプレート選択", "出力設定"]
-        if 0 <= index < len(tab_names):
-            self.status_label.setText(f"現在のタブ: {tab_names[index]}")
-            self.logger.log_operation(f"タブ切り替え: {tab_names[index]}")
+        if 0 <= index < len(self.TAB_NAMES):
+            self.status_label.setText(f"現在のタブ: {self.TAB_NAMES[index]}")
+            self.logger.log_operation(f"タブ切り替え: {self.TAB_NAMES[index]}")
     
     def on_log_saved(self, log_date, success):
         """ログ保存完了時の処理"""
@@ -436,6 +444,9 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """ウィンドウクローズイベント"""
+        # 実行中のログ保存を待つ
+        self.log_input_widget.wait_for_save()
+        
         # 設定を保存
         self.save_settings()
         
@@ -3,22 +3,24 @@
 出力設定ウィジェット
 """
 
+import os
 from typing import Optional, Dict, Any, List
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                              QLabel, QGroupBox, QComboBox, QLineEdit, QPushButton,
                              QFileDialog, QTextEdit, QCheckBox, QSpinBox,
                              QTabWidget, QTableWidget, QTableWidgetItem,
                              QProgressBar, QListWidget, QListWidgetItem,
                              QMessageBox, QSplitter, QScrollArea, QDateEdit)
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QDate
 from PySide6.QtGui import QFont
 
 from core.template_engine import TemplateEngine
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 from utils.file_utils import FileUtils
+from utils.date_utils import DateUtils
 
 class OutputWorker(QThread):
     """出力処理ワーカー"""
@@ -240,7 +242,6 @@ class OutputHistoryWidget(QWidget):
         current_item = self.history_list.currentItem()
         if current_item:
             file_path = current_item.data(Qt.UserRole)
-            import os
             os.startfile(file_path)
             
     def delete_selected_file(self):
@@ -264,6 +265,9 @@ class OutputConfigWidget(QWidget):
     # シグナル定義
     output_completed = Signal(str)  # file_path
     
+    # 出力形式の選択肢
+    OUTPUT_FORMATS = ("txt", "csv", "xlsx", "docx")
+    
     def __init__(self, template_engine: TemplateEngine, config_manager: ConfigManager,
                  logger: Logger, app_dir: Path, data_manager=None, parent=None):
         super().__init__(parent)
@@ -304,7 +308,7 @@ class OutputConfigWidget(QWidget):
         
         # 出力形式
         self.format_combo = QComboBox()
-        self.format_combo.addItems(["txt", "csv", "xlsx", "docx"])
+        self.format_combo.addItems(self.OUTPUT_FORMATS)
         self.format_combo.currentTextChanged.connect(self.on_format_changed)
         basic_layout.addRow("出力形式:", self.format_combo)
         
@@ -356,9 +360,6 @@ class OutputConfigWidget(QWidget):
         period_layout = QFormLayout(period_group)
         
         # 開始日
-        from PySide6.QtCore import QDate
-        from datetime import datetime, timedelta
-        
         self.start_date_edit = QDateEdit()
         self.start_date_edit.setDate(QDate.currentDate().addDays(-7))
         self.start_date_edit.setCalendarPopup(True)
@@ -508,9 +509,6 @@ class OutputConfigWidget(QWidget):
         
         try:
             # 設定された期間で作業ログを取得
-            from datetime import datetime, timedelta
-            from utils.date_utils import DateUtils
-            
             # 期間設定を取得
             start_date = self.start_date_edit.date().toPython()
             end_date = self.end_date_edit.date().toPython()
@@ -574,8 +572,6 @@ class OutputConfigWidget(QWidget):
     
     def set_period_preset(self, days: int):
         """期間プリセットを設定"""
-        from PySide6.QtCore import QDate
-        
         end_date = QDate.currentDate()
         start_date = end_date.addDays(-days)
         
@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
                              QListWidgetItem, QTextEdit, QLabel, QGroupBox,
                              QSplitter, QPushButton, QComboBox, QSpinBox,
                              QCheckBox, QScrollArea, QFormLayout)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
 from PySide6.QtGui import QFont
 
 from core.template_engine import TemplateEngine
@@ -126,6 +126,9 @@ class TemplatePreviewWidget(QWidget):
 class TemplateConfigWidget(QWidget):
     """テンプレート設定ウィジェット"""
     
+    # 既定の出力フォーマット
+    OUTPUT_FORMATS = ("txt", "csv", "xlsx", "docx")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_template = None
@@ -152,7 +155,7 @@ class TemplateConfigWidget(QWidget):
         """設定項目を追加"""
         # 出力フォーマット選択
         self.format_combo = QComboBox()
-        self.format_combo.addItems(["txt", "csv", "xlsx", "docx"])
+        self.format_combo.addItems(self.OUTPUT_FORMATS)
         self.config_layout.addRow("出力フォーマット:", self.format_combo)
         
         # 要約レベル
@@ -187,12 +190,14 @@ class TemplateConfigWidget(QWidget):
         self.current_template = template_info
         
         # 対応フォーマットに基づいてコンボボックスを更新
-        self.format_combo.clear()
+        # （入れ替え途中の選択変更シグナルは抑止する）
         if template_info and 'output_formats' in template_info:
             formats = template_info['output_formats']
-            self.format_combo.addItems(formats)
         else:
-            self.format_combo.addItems(["txt", "csv", "xlsx", "docx"])
+            formats = self.OUTPUT_FORMATS
+        with QSignalBlocker(self.format_combo):
+            self.format_combo.clear()
+            self.format_combo.addItems(formats)
             
     def get_config(self) -> Dict[str, Any]:
         """設定を取得"""
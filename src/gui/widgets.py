@@ -4,7 +4,7 @@
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QLineEdit, QPushButton, QTextEdit, QComboBox,
+                             QLineEdit, QPushButton, QTextEdit, QPlainTextEdit, QComboBox,
                              QDateEdit, QSpinBox, QCheckBox, QListWidget,
                              QTableWidget, QTableWidgetItem, QHeaderView,
                              QProgressBar, QGroupBox, QFrame)
@@ -94,16 +94,23 @@ class LogStatisticsWidget(QWidget):
     
     def update_statistics(self, stats):
         """統計情報を更新"""
-        self.stats_table.setRowCount(len(stats))
-        
-        for row, (key, value) in enumerate(stats.items()):
-            # 項目名
-            item_name = QTableWidgetItem(str(key))
-            self.stats_table.setItem(row, 0, item_name)
-            
-            # 値
-            item_value = QTableWidgetItem(str(value))
-            self.stats_table.setItem(row, 1, item_value)
+        # 項目名・値のアイテムを先に作っておく
+        rows = [(QTableWidgetItem(str(key)), QTableWidgetItem(str(value)))
+                for key, value in stats.items()]
+        
+        # 行ごとの再描画・シグナル発行を抑えてまとめて反映する
+        table = self.stats_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            for row, (item_name, item_value) in enumerate(rows):
+                table.setItem(row, 0, item_name)
+                table.setItem(row, 1, item_value)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
 
 class ProgressWidget(QWidget):
     """プログレス表示ウィジェット"""
@@ -299,8 +306,13 @@ class OutputFormatWidget(QWidget):
 class LogPreviewWidget(QWidget):
     """ログプレビューウィジェット"""
     
+    # 表示する最大行数と1行あたりの最大文字数
+    MAX_BLOCK_COUNT = 50
+    MAX_LINE_LENGTH = 200
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._preview_source = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -312,16 +324,29 @@ class LogPreviewWidget(QWidget):
         title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
         layout.addWidget(title_label)
         
-        # プレビューエリア
-        self.preview_text = QTextEdit()
+        # プレビューエリア（リッチテキスト処理が不要なためQPlainTextEditを使う）
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
+        self.preview_text.setUndoRedoEnabled(False)
+        self.preview_text.setMaximumBlockCount(self.MAX_BLOCK_COUNT)
         self.preview_text.setMaximumHeight(200)
         layout.addWidget(self.preview_text)
     
     def set_preview_text(self, text):
         """プレビューテキストを設定"""
-        self.preview_text.setPlainText(text)
+        # 内容が変わらない場合は再レイアウトしない
+        if text == self._preview_source:
+            return
+        self._preview_source = text
+        
+        # 貼り付けられた長い1行で表示が重くならないよう行ごとに切り詰める
+        limit = self.MAX_LINE_LENGTH
+        lines = text.split("\n")[:self.MAX_BLOCK_COUNT]
+        self.preview_text.setPlainText("\n".join(
+            line if len(line) <= limit else line[:limit] + "..." for line in lines
+        ))
     
     def clear_preview(self):
         """プレビューをクリア"""
+        self._preview_source = None
         self.preview_text.clear() 
\ No newline at end of file
@@ -3,11 +3,14 @@
 設定管理クラス
 """
 
-import json
+import os
+import copy
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from utils.file_utils import FileUtils
+
 class ConfigManager:
     """アプリケーション設定管理クラス"""
     
@@ -27,6 +30,9 @@ class ConfigManager:
         self.templates_config_path = self.config_dir / "templates_config.yaml"
         self.output_config_path = self.config_dir / "output_config.yaml"
         
+        # JSON設定のキャッシュ（パス → (更新時刻, データ)）
+        self._json_cache = {}
+        
         # デフォルト設定
         self.default_app_config = {
             "app_name": "ドキュメント自動要約&作成アプリ",
@@ -181,19 +187,42 @@ class ConfigManager:
             print(f"YAML保存エラー ({file_path}): {e}")
     
     def load_json(self, file_path: Path) -> Dict[str, Any]:
-        """JSONファイルを読み込み"""
+        """
+        JSONファイルを読み込み
+        
+        ファイルが更新されていなければ前回読み込み・保存した内容を返す。
+        呼び出し側で変更してもキャッシュに影響しないようコピーを返す。
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            mtime = os.stat(file_path).st_mtime_ns
+            cached = self._json_cache.get(file_path)
+            if cached and cached[0] == mtime:
+                return copy.deepcopy(cached[1])
+            
+            data = FileUtils.read_json_file(file_path)
+            
+            self._json_cache[file_path] = (mtime, data)
+            return copy.deepcopy(data)
         except Exception as e:
             print(f"JSON読み込みエラー ({file_path}): {e}")
             return {}
     
     def save_json(self, file_path: Path, data: Dict[str, Any]):
-        """JSONファイルに保存"""
+        """JSONファイルに保存（一時ファイルに書いてから置き換える）"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, ensure_ascii=False, indent=2)
+            # 前回読み込み・保存した内容から変わっておらず、ファイルも
+            # 外部で更新されていなければ書き込みを省略する
+            cached = self._json_cache.get(file_path)
+            if cached and cached[1] == data:
+                try:
+                    if os.stat(file_path).st_mtime_ns == cached[0]:
+                        return
+                except OSError:
+                    pass
+            
+            FileUtils.write_json_file(file_path, data)
+            
+            self._json_cache[file_path] = (os.stat(file_path).st_mtime_ns, copy.deepcopy(data))
         except Exception as e:
             print(f"JSON保存エラー ({file_path}): {e}")
     
@@ -6,6 +6,7 @@
 from datetime import datetime, date, timedelta
 from typing import List, Tuple, Optional
 import calendar
+import functools
 
 class DateUtils:
     """日付処理ユーティリティクラス"""
@@ -30,9 +31,10 @@ class DateUtils:
         return datetime.now()
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def format_date(target_date: date, format_str: str = "%Y-%m-%d") -> str:
         """
-        日付をフォーマット
+        日付をフォーマット（同じ日付・フォーマットの再変換はキャッシュから返す）
         
         Args:
             target_date: 対象日付
@@ -44,9 +46,10 @@ class DateUtils:
         return target_date.strftime(format_str)
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def parse_date(date_str: str, format_str: str = "%Y-%m-%d") -> Optional[date]:
         """
-        文字列から日付を解析
+        文字列から日付を解析（同じ文字列の再解析はキャッシュから返す）
         
         Args:
             date_str: 日付文字列
@@ -172,9 +175,10 @@ class DateUtils:
         return business_days
     
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def format_date_japanese(target_date: date) -> str:
         """
-        日本語形式で日付をフォーマット
+        日本語形式で日付をフォーマット（同じ日付の再変換はキャッシュから返す）
         
         Args:
             target_date: 対象日付
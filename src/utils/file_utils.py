@@ -4,11 +4,19 @@
 """
 
 import os
+import json
 import shutil
 import chardet
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+# オプション：高速JSONライブラリ
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class FileUtils:
     """ファイル操作ユーティリティクラス"""
     
@@ -55,6 +63,65 @@ class FileUtils:
         except Exception as e:
             raise IOError(f"ファイルの書き込みに失敗しました: {e}")
     
+    @staticmethod
+    def dumps_json(data: Any, indent: bool = True) -> bytes:
+        """
+        データをUTF-8のJSONバイト列に変換
+        
+        Args:
+            data: 変換するデータ
+            indent: インデント2で整形するかどうか（Falseの場合は空白なし）
+            
+        Returns:
+            bytes: JSONバイト列
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(data, option=option)
+        if indent:
+            return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    @staticmethod
+    def read_json_file(file_path: Path) -> Any:
+        """
+        JSONファイルを読み込み
+        
+        Args:
+            file_path: ファイルパス
+            
+        Returns:
+            Any: 読み込んだデータ
+        """
+        raw_data = Path(file_path).read_bytes()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(raw_data)
+        return json.loads(raw_data)
+    
+    @staticmethod
+    def write_json_file(file_path: Path, data: Any, indent: bool = True):
+        """
+        JSONファイルに書き込み
+        
+        一時ファイルに書き込んでから置き換えるため、書き込み途中で
+        中断しても既存のファイルが壊れることはない。
+        
+        Args:
+            file_path: ファイルパス
+            data: 書き込むデータ
+            indent: インデント2で整形するかどうか（Falseの場合は空白なし）
+        """
+        try:
+            file_path = Path(file_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            temp_path = file_path.with_name(file_path.name + ".tmp")
+            temp_path.write_bytes(FileUtils.dumps_json(data, indent))
+            os.replace(temp_path, file_path)
+            
+        except Exception as e:
+            raise IOError(f"ファイルの書き込みに失敗しました: {e}")
+    
     @staticmethod
     def detect_encoding(file_path: Path) -> str:
         """
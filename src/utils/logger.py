@@ -3,6 +3,8 @@
 ログ機能クラス
 """
 
+import atexit
+import queue
 import logging
 import logging.handlers
 from pathlib import Path
@@ -37,16 +39,25 @@ class Logger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        # コンソールハンドラーを追加
+        # コンソールハンドラーを作成
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
         
-        # ファイルハンドラーを追加（指定されている場合）
+        # ファイルハンドラーを作成（指定されている場合）
         if log_file:
-            self._setup_file_handler(log_file, formatter)
+            file_handler = self._setup_file_handler(log_file, formatter)
+            if file_handler:
+                handlers.append(file_handler)
+        
+        # 書き込みは別スレッドで行い、呼び出し側はキューに積むだけにする
+        self._queue = queue.Queue()
+        self.logger.addHandler(logging.handlers.QueueHandler(self._queue))
+        self._listener = logging.handlers.QueueListener(self._queue, *handlers)
+        self._listener.start()
+        atexit.register(self.close)
     
-    def _setup_file_handler(self, log_file: Path, formatter: logging.Formatter):
+    def _setup_file_handler(self, log_file: Path, formatter: logging.Formatter) -> Optional[logging.Handler]:
         """ファイルハンドラーを設定"""
         try:
             # ログディレクトリを作成
@@ -61,10 +72,17 @@ class Logger:
                 encoding='utf-8'
             )
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            return file_handler
             
         except Exception as e:
             self.logger.error(f"ファイルハンドラーの設定に失敗しました: {e}")
+            return None
+    
+    def close(self):
+        """キューに残ったログを書き出して書き込みスレッドを停止"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
     
     def debug(self, message: str):
         """デバッグメッセージを出力"""